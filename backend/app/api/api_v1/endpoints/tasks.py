@@ -1,11 +1,11 @@
 import asyncio
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
 from app.tasks.task_manager import task_manager # Singleton instance
-from app.tasks.task_types import TaskType
+from app.tasks.task_types import TaskStatus, TaskType
 
 router = APIRouter()
 
@@ -13,7 +13,7 @@ router = APIRouter()
 
 async def run_data_collection_task(task_id: str, params: Dict[str, Any]):
     """Example background task implementation with error handling."""
-    await task_manager.update_task_status(task_id, status="running")
+    await task_manager.update_task_status(task_id, status=TaskStatus.RUNNING)
     try:
         # Simulate work
         print(f"Running task {task_id} (Data Collection) with params: {params}")
@@ -21,7 +21,7 @@ async def run_data_collection_task(task_id: str, params: Dict[str, Any]):
         account_id = params.get("account_id", "unknown")
         result = {"collected_items": 100, "account_processed": account_id}
         print(f"Task {task_id} completed.")
-        await task_manager.update_task_status(task_id, status="completed", result=result)
+        await task_manager.update_task_status(task_id, status=TaskStatus.COMPLETED, result=result)
 
         # --- Simple Workflow Example --- 
         # If this task succeeds, create a follow-up analysis task
@@ -36,23 +36,23 @@ async def run_data_collection_task(task_id: str, params: Dict[str, Any]):
     except Exception as e:
         error_msg = f"Task {task_id} failed: {str(e)}"
         print(error_msg)
-        await task_manager.update_task_status(task_id, status="failed", error=error_msg)
+        await task_manager.update_task_status(task_id, status=TaskStatus.FAILED, error=error_msg)
     # finally: 
         # Add cleanup logic here if needed
 
 async def run_content_analysis_task(task_id: str, params: Dict[str, Any]):
     """Example background task for content analysis."""
-    await task_manager.update_task_status(task_id, status="running")
+    await task_manager.update_task_status(task_id, status=TaskStatus.RUNNING)
     try:
         print(f"Running task {task_id} (Content Analysis) with params: {params}")
         await asyncio.sleep(3)
         result = {"analysis_complete": True, "sentiment": "positive", "source": params.get("source_task_id")}
         print(f"Task {task_id} completed.")
-        await task_manager.update_task_status(task_id, status="completed", result=result)
+        await task_manager.update_task_status(task_id, status=TaskStatus.COMPLETED, result=result)
     except Exception as e:
         error_msg = f"Task {task_id} failed: {str(e)}"
         print(error_msg)
-        await task_manager.update_task_status(task_id, status="failed", error=error_msg)
+        await task_manager.update_task_status(task_id, status=TaskStatus.FAILED, error=error_msg)
 
 # Mapping task types to their execution functions
 TASK_RUNNERS = {
@@ -72,7 +72,7 @@ class TaskCreateResponse(BaseModel):
 
 class TaskStatusResponse(BaseModel):
     task_id: str
-    status: str
+    status: TaskStatus
     created_at: Any # Use Any for simplicity, ideally datetime
     updated_at: Any # Use Any for simplicity, ideally datetime
     result: Optional[Any] = None
@@ -81,10 +81,7 @@ class TaskStatusResponse(BaseModel):
 # --- API Endpoints --- 
 
 @router.post("/", response_model=TaskCreateResponse, status_code=status.HTTP_202_ACCEPTED)
-async def create_task_endpoint(
-    task_request: TaskCreateRequest,
-    background_tasks: BackgroundTasks
-):
+async def create_task_endpoint(task_request: TaskCreateRequest):
     """Creates a new task and schedules it for background execution."""
     if task_request.task_type not in TASK_RUNNERS:
         raise HTTPException(
@@ -97,8 +94,15 @@ async def create_task_endpoint(
     # Get the appropriate runner function for the task type
     task_runner = TASK_RUNNERS[task_request.task_type]
     
-    # Add the task runner to FastAPI's background tasks
-    background_tasks.add_task(task_runner, task_id=task_id, params=task_request.params)
+    # Hand the task runner to the task manager's worker pool
+    try:
+        task_manager.execute_task_async(task_runner, task_id=task_id, params=task_request.params)
+    except asyncio.QueueFull:
+        await task_manager.update_task_status(task_id, status=TaskStatus.FAILED, error="Task queue is full")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many tasks are queued, please retry later"
+        )
     
     return {"task_id": task_id}
 
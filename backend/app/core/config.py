@@ -148,6 +148,20 @@ class Settings(BaseSettings):
     
     # APIFY settings (MVP)
     APIFY_API_KEY: str = ""
+    APIFY_FACEBOOK_ACTOR_ID: str = "apify/facebook-posts-scraper"
+    APIFY_INSTAGRAM_ACTOR_ID: str = "apify/instagram-scraper"
+    APIFY_TWITTER_ACTOR_ID: str = "apidojo/twitter-scraper-lite"
+
+    # Scraping settings (MVP)
+    SCRAPING_MAX_POSTS: int = 100  # Posts collected per account and run
+    SCRAPING_MAX_COMMENTS: int = 100  # Comments collected per post and run
+    SCRAPING_DEFAULT_DAYS_BACK: int = 30  # How far back collection goes by default
+    SCRAPING_MIN_REQUEST_INTERVAL: float = 1.0  # Minimum seconds between APIFY requests
+
+    # Task manager settings (MVP)
+    TASK_MAX_AGE_HOURS: int = 24  # How long finished task state is kept
+    TASK_WORKERS: int = 4  # Number of background task worker coroutines
+    TASK_QUEUE_SIZE: int = 100  # Maximum number of tasks waiting for a worker
 
     # Anthropic settings (MVP)
     ANTHROPIC_API_KEY: str = ""
@@ -42,6 +42,10 @@ class KeyPatterns:
     ALERTS_USER = f"{NAMESPACE}:alerts:user:{{user_id}}"  # Sorted Set
     ALERTS_TOPIC = f"{NAMESPACE}:alerts:topic:{{topic}}"  # Pub/Sub Channel
     
+    # Background task state
+    TASK = f"{NAMESPACE}:task:{{task_id}}"  # Hash
+    TASKS_BY_CREATED = f"{NAMESPACE}:tasks:created"  # Sorted Set
+    
     # API rate limiting
     RATE_LIMIT_IP = f"{NAMESPACE}:ratelimit:ip:{{ip_address}}"  # String with counter
     RATE_LIMIT_USER = f"{NAMESPACE}:ratelimit:user:{{user_id}}"  # String with counter
@@ -19,6 +19,9 @@ from app.core.errors import add_exception_handlers
 from app.db.connections import pinecone_conn
 from app.schemas import StandardResponse
 from app.db.mongo_utils import get_mongo_client, close_mongo_connection
+from app.processing.collection.apify_client import close_http_session
+from app.processing.collection.factory import CollectorFactory
+from app.tasks.task_manager import task_manager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -166,10 +169,23 @@ async def startup_db_client() -> None:
         logger.warning(f"Failed to connect to Pinecone: {e}")
         # Continue without raising the exception
 
+    # Social media collectors, created once and shared by all tasks
+    try:
+        CollectorFactory.initialize_collectors()
+    except Exception as e:
+        logger.warning(f"Failed to initialize collectors: {e}")
+        # Collectors will be created on first use instead
+
+    # Background task workers
+    task_manager.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_db_client() -> None:
     """Close database connections on application shutdown."""
+    # Stop background task workers before closing the connections they use
+    await task_manager.stop()
+
     try:
         # Close connections in reverse order of initialization
         
@@ -179,6 +195,9 @@ async def shutdown_db_client() -> None:
             pinecone_conn.close()
             logger.info("Pinecone connection closed")
 
+        # Close the shared APIFY HTTP connection pool
+        await close_http_session()
+
         # Close MongoDB (async)
         # Use the new utility function
         await close_mongo_connection() 
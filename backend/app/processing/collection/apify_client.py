@@ -17,6 +17,55 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Longest time APIFY will hold a run status request open with waitForFinish
+APIFY_MAX_WAIT_FOR_FINISH = 60
+
+# Longest delay honoured from a Retry-After header before retrying a request
+APIFY_MAX_RETRY_AFTER = 60
+
+class ApifyRequestError(HTTPException):
+    """
+    An APIFY API request failed (error response or connection failure).
+    
+    Raised only for the request itself, so callers can tell a failed request,
+    which may succeed when repeated, from a failed or timed-out actor run.
+    """
+
+
+# HTTP session shared by all APIFY clients so connections are pooled and reused
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it on first use.
+    
+    Returns:
+        An aiohttp session backed by a keep-alive connection pool
+    """
+    global _http_session
+    
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=30,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+        )
+    
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session, if it was created."""
+    global _http_session
+    
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
 
 class ApifyClient:
     """
@@ -26,8 +75,14 @@ class ApifyClient:
     from APIFY actors. It includes error handling, retries, and rate limiting.
     """
     
-    def __init__(self):
-        """Initialize the APIFY client with API key from settings."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize the APIFY client with API key from settings.
+        
+        Args:
+            session: Optional HTTP session to use (defaults to the shared session)
+        """
+        self._session = session
         self.api_key = settings.APIFY_API_KEY
         self.base_url = "https://api.apify.com/v2"
         self.default_headers = {
@@ -59,6 +114,11 @@ class ApifyClient:
         """
         Make an HTTP request to the APIFY API with retry logic.
         
+        Rate-limited (429) and server error (5xx) responses and connection
+        failures are retried with exponential backoff, or after the delay
+        the response's Retry-After header asks for. Only this one request is
+        repeated, so retries never start another actor run.
+        
         Args:
             method: HTTP method (GET, POST, DELETE)
             endpoint: API endpoint (relative to base URL)
@@ -71,49 +131,52 @@ class ApifyClient:
             Parsed JSON response
             
         Raises:
-            HTTPException: If the request fails after all retries
+            ApifyRequestError: If the request fails after all retries
         """
         url = f"{self.base_url}{endpoint}"
         
         # Enforce rate limiting
         await self._enforce_rate_limit()
         
+        session = self._session or get_http_session()
+        
         for attempt in range(retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.request(
-                        method=method,
-                        url=url,
-                        headers=self.default_headers,
-                        json=data if data else None,
-                        params=params if params else None
-                    ) as response:
-                        if response.status >= 400:
-                            response_text = await response.text()
-                            logger.error(
-                                f"APIFY API error: {response.status}, {response_text}, "
-                                f"Endpoint: {endpoint}, Attempt: {attempt + 1}/{retries}"
+                async with session.request(
+                    method=method,
+                    url=url,
+                    headers=self.default_headers,
+                    json=data if data else None,
+                    params=params if params else None
+                ) as response:
+                    if response.status >= 400:
+                        response_text = await response.text()
+                        logger.error(
+                            f"APIFY API error: {response.status}, {response_text}, "
+                            f"Endpoint: {endpoint}, Attempt: {attempt + 1}/{retries}"
+                        )
+                        
+                        retry_after = response.headers.get("Retry-After")
+                        
+                        # Raise error on last attempt or for 4xx client errors (except 429)
+                        if attempt == retries - 1 or (400 <= response.status < 500 and response.status != 429):
+                            raise ApifyRequestError(
+                                status_code=response.status,
+                                detail=f"APIFY API error: {response_text}",
+                                headers={"Retry-After": retry_after} if retry_after else None
                             )
-                            
-                            # Raise error on last attempt or for 4xx client errors (except 429)
-                            if attempt == retries - 1 or (400 <= response.status < 500 and response.status != 429):
-                                raise HTTPException(
-                                    status_code=response.status,
-                                    detail=f"APIFY API error: {response_text}"
-                                )
-                            
-                            # Exponential backoff delay
-                            delay = retry_delay * (2 ** attempt)
-                            await asyncio.sleep(delay)
-                            continue
                         
-                        return await response.json()
+                        # Wait as long as APIFY asks, else back off exponentially
+                        await asyncio.sleep(self._retry_delay(retry_after, retry_delay * (2 ** attempt)))
+                        continue
+                    
+                    return await response.json()
                         
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.error(f"APIFY API connection error: {str(e)}, Attempt: {attempt + 1}/{retries}")
                 
                 if attempt == retries - 1:
-                    raise HTTPException(
+                    raise ApifyRequestError(
                         status_code=503,
                         detail=f"Failed to connect to APIFY API after {retries} attempts: {str(e)}"
                     )
@@ -125,6 +188,25 @@ class ApifyClient:
         # This code should never be reached, but return an empty dict to satisfy type checking
         return {}
     
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], default: float) -> float:
+        """
+        Get the delay before retrying a request.
+        
+        Args:
+            retry_after: Value of the response's Retry-After header, if any
+            default: Delay to use if the header is missing or not a number of seconds
+            
+        Returns:
+            Delay in seconds, at most APIFY_MAX_RETRY_AFTER when taken from the header
+        """
+        if retry_after:
+            try:
+                return min(float(retry_after), APIFY_MAX_RETRY_AFTER)
+            except ValueError:
+                pass
+        return default
+    
     async def start_actor_run(
         self,
         actor_id: str,
@@ -155,18 +237,21 @@ class ApifyClient:
         logger.info(f"APIFY actor run started: {run_id}")
         return run_id
     
-    async def get_run_status(self, run_id: str) -> Dict[str, Any]:
+    async def get_run_status(self, run_id: str, wait_for_finish: int = 0) -> Dict[str, Any]:
         """
         Get the status of an APIFY actor run.
         
         Args:
             run_id: ID of the actor run
+            wait_for_finish: Seconds for APIFY to hold the request open until
+                the run finishes (0 returns immediately, APIFY allows up to 60)
             
         Returns:
             Run status details
         """
         endpoint = f"/actor-runs/{run_id}"
-        return await self._make_request("GET", endpoint)
+        params = {"waitForFinish": wait_for_finish} if wait_for_finish else None
+        return await self._make_request("GET", endpoint, params=params)
     
     async def is_run_finished(self, run_id: str) -> bool:
         """
@@ -191,9 +276,13 @@ class ApifyClient:
         """
         Wait for an APIFY actor run to finish.
         
+        Each status request long-polls APIFY, which answers as soon as the
+        run finishes. If a request comes back early without the run having
+        finished, the next one is delayed with exponential backoff.
+        
         Args:
             run_id: ID of the actor run
-            check_interval: Interval between status checks in seconds
+            check_interval: Maximum delay between status requests in seconds
             max_wait_time: Maximum wait time in seconds
             
         Returns:
@@ -204,10 +293,25 @@ class ApifyClient:
         """
         logger.info(f"Waiting for APIFY actor run to finish: {run_id}")
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        delay = 0.5
         
         while True:
-            run_info = await self.get_run_status(run_id)
+            remaining = max_wait_time - (time.monotonic() - start_time)
+            
+            # Check for timeout
+            if remaining <= 0:
+                logger.error(f"Timed out waiting for APIFY actor run: {run_id}")
+                raise HTTPException(
+                    status_code=504,
+                    detail=f"Timed out waiting for APIFY actor run after {max_wait_time} seconds"
+                )
+            
+            request_start = time.monotonic()
+            run_info = await self.get_run_status(
+                run_id,
+                wait_for_finish=max(1, min(APIFY_MAX_WAIT_FOR_FINISH, int(remaining)))
+            )
             status = run_info.get("data", {}).get("status")
             
             if status == "SUCCEEDED":
@@ -221,15 +325,11 @@ class ApifyClient:
                     detail=f"APIFY actor run failed with status: {status}"
                 )
             
-            # Check for timeout
-            if time.time() - start_time > max_wait_time:
-                logger.error(f"Timed out waiting for APIFY actor run: {run_id}")
-                raise HTTPException(
-                    status_code=504,
-                    detail=f"Timed out waiting for APIFY actor run after {max_wait_time} seconds"
-                )
-            
-            await asyncio.sleep(check_interval)
+            # A long poll that ran its course can be retried right away; only
+            # back off when APIFY answered early without a final status
+            if time.monotonic() - request_start < 1:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, check_interval)
     
     async def get_run_results(
         self,
@@ -295,7 +395,7 @@ class ApifyClient:
             actor_id: ID of the APIFY actor to run
             run_input: Actor input parameters
             limit: Maximum number of results to retrieve
-            check_interval: Interval between status checks in seconds
+            check_interval: Maximum delay between status requests in seconds
             max_wait_time: Maximum wait time in seconds
             
         Returns:
@@ -7,8 +7,8 @@ and common functionality for all platform-specific social media collectors.
 
 import abc
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from app.core.config import settings
@@ -19,6 +19,29 @@ from app.services.repositories.comment_repository import CommentRepository
 logger = logging.getLogger(__name__)
 
 
+def first_of(data: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    Get the value of the first of several alternative keys that is set.
+    
+    APIFY actors name the same field differently between versions (e.g.
+    "pageId" or "id"); this checks the keys in order and stops at the first
+    one with a non-None value.
+    
+    Args:
+        data: Raw item from APIFY
+        keys: Keys to try, in order of preference
+        default: Value to return if none of the keys is set
+        
+    Returns:
+        The first non-None value found, or the default
+    """
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return default
+
+
 class BaseCollector(abc.ABC):
     """
     Abstract base class for social media data collectors.
@@ -26,8 +49,16 @@ class BaseCollector(abc.ABC):
     This class defines the interface for platform-specific collectors 
     and provides common functionality for interacting with APIFY 
     and transforming collected data.
+    
+    Collectors whose APIFY actor accepts many accounts per run set
+    ``supports_batch_collection`` and implement ``collect_posts_batch``
+    (same arguments as ``collect_posts``, with a list of account IDs,
+    returning post IDs keyed by account ID).
     """
     
+    # Whether the collector implements collect_posts_batch
+    supports_batch_collection: bool = False
+    
     def __init__(
         self,
         apify_client: Optional[ApifyClient] = None,
@@ -182,6 +213,27 @@ class BaseCollector(abc.ABC):
         """
         pass
     
+    def transform_posts_batch(
+        self,
+        raw_posts: List[Dict[str, Any]],
+        account_id: Union[UUID, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Transform a list of raw posts from APIFY in one call.
+        
+        Platforms can override this to compute values shared by every post
+        (e.g. timestamps derived from the account) once per batch.
+        
+        Args:
+            raw_posts: Raw post data from APIFY
+            account_id: UUID of the social media account
+            
+        Returns:
+            Transformed post data, in the same order as raw_posts
+        """
+        transform = self.transform_post
+        return [transform(raw_post, account_id) for raw_post in raw_posts]
+    
     @abc.abstractmethod
     def transform_comment(self, raw_comment: Dict[str, Any], post_id: str) -> Dict[str, Any]:
         """
@@ -226,8 +278,19 @@ class BaseCollector(abc.ABC):
         """
         post_ids = []
         
-        for raw_post in posts:
+        try:
+            transformed_posts = self.transform_posts_batch(posts, account_id)
+        except Exception as e:
+            # Fall back to transforming posts one at a time so a single bad
+            # post only loses itself
+            logger.warning("Batch post transform failed, retrying per post: %s", e)
+            transformed_posts = [None] * len(posts)
+        
+        for raw_post, post_data in zip(posts, transformed_posts):
             try:
+                if post_data is None:
+                    post_data = self.transform_post(raw_post, account_id)
+                
                 # Check if post already exists
                 existing_post = await self.post_repository.get_by_platform_id(
                     platform=self.platform_name,
@@ -236,7 +299,6 @@ class BaseCollector(abc.ABC):
                 
                 if existing_post:
                     # Update engagement metrics
-                    post_data = self.transform_post(raw_post, account_id)
                     await self.post_repository.update_engagement_metrics(
                         post_id=str(existing_post["_id"]),
                         metrics=post_data["engagement"]
@@ -244,12 +306,11 @@ class BaseCollector(abc.ABC):
                     post_ids.append(str(existing_post["_id"]))
                 else:
                     # Create new post
-                    post_data = self.transform_post(raw_post, account_id)
                     post_id = await self.post_repository.create(post_data)
                     post_ids.append(post_id)
             
             except Exception as e:
-                logger.error(f"Error saving post: {str(e)}", exc_info=True)
+                logger.error("Error saving post: %s", e, exc_info=True)
         
         return post_ids
     
@@ -293,10 +354,36 @@ class BaseCollector(abc.ABC):
                     comment_ids.append(comment_id)
             
             except Exception as e:
-                logger.error(f"Error saving comment: {str(e)}", exc_info=True)
+                logger.error("Error saving comment: %s", e, exc_info=True)
         
         return comment_ids
     
+    @staticmethod
+    def parse_iso_datetime(value: str) -> datetime:
+        """
+        Parse an ISO 8601 timestamp as returned by APIFY actors.
+        
+        Handles the trailing "Z" UTC designator, which datetime.fromisoformat
+        only accepts from Python 3.11 on. Timestamps with an offset are
+        converted to naive UTC, like the datetime.utcnow() values the
+        collectors use elsewhere, so the two can be compared.
+        
+        Args:
+            value: Timestamp string (e.g., "2025-02-26T20:35:33.000Z")
+            
+        Returns:
+            Naive datetime in UTC
+            
+        Raises:
+            ValueError: If the value is not a valid ISO 8601 timestamp
+        """
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    
     def extract_hashtags(self, text: str) -> List[str]:
         """
         Extract hashtags from text.
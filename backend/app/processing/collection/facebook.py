@@ -5,17 +5,20 @@ This module provides a collector for Facebook data using APIFY's Facebook Scrape
 """
 
 import logging
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlparse
 from uuid import UUID
 
 from app.core.config import settings
-from app.processing.collection.base import BaseCollector
+from app.processing.collection.base import BaseCollector, first_of
 from app.services.repositories.social_media_account import SocialMediaAccountRepository
 
 logger = logging.getLogger(__name__)
 
+# First path segment of a page URL (e.g. "https://www.facebook.com/<handle>/about")
+PAGE_HANDLE_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*://)?[^/?#]*/([^/?#]+)", re.IGNORECASE)
+
 
 class FacebookCollector(BaseCollector):
     """
@@ -285,7 +288,7 @@ class FacebookCollector(BaseCollector):
             Transformed post data
         """
         # Extract basic information
-        post_id = raw_post.get("postId", raw_post.get("id", ""))
+        post_id = first_of(raw_post, ("postId", "id"), "")
         text = raw_post.get("text", "")
         
         # Handle created_at (Facebook format can vary)
@@ -394,7 +397,7 @@ class FacebookCollector(BaseCollector):
             Transformed comment data
         """
         # Extract basic information
-        comment_id = raw_comment.get("commentId", raw_comment.get("id", ""))
+        comment_id = first_of(raw_comment, ("commentId", "id"), "")
         text = raw_comment.get("text", "")
         
         # Extract user info
@@ -429,7 +432,7 @@ class FacebookCollector(BaseCollector):
         }
         
         # Fetch post URL from post_repository if available
-        post_url = raw_comment.get("postUrl", raw_comment.get("facebookUrl", ""))
+        post_url = first_of(raw_comment, ("postUrl", "facebookUrl"), "")
         
         # Extract additional user fields
         user_full_name = raw_comment.get("profileName", "")
@@ -457,7 +460,7 @@ class FacebookCollector(BaseCollector):
                 # Parse created_at if available
                 if "date" in reply:
                     try:
-                        reply_obj["created_at"] = datetime.fromisoformat(reply["date"].replace('Z', '+00:00'))
+                        reply_obj["created_at"] = self.parse_iso_datetime(reply["date"])
                     except (ValueError, TypeError):
                         pass
                 
@@ -517,18 +520,15 @@ class FacebookCollector(BaseCollector):
             Transformed profile data
         """
         # Extract the page ID and handle
-        page_id = raw_profile.get("pageId", raw_profile.get("id", ""))
+        page_id = first_of(raw_profile, ("pageId", "id"), "")
         page_url = raw_profile.get("url", "")
         handle = ""
         
         # Try to extract handle from URL
         if page_url:
-            try:
-                path = urlparse(page_url).path
-                if path and path != "/":
-                    handle = path.strip("/").split("/")[0]
-            except Exception:
-                pass
+            match = PAGE_HANDLE_RE.match(page_url)
+            if match:
+                handle = match.group(1)
         
         # Use name if handle extraction failed
         if not handle:
@@ -541,7 +541,7 @@ class FacebookCollector(BaseCollector):
             "name": raw_profile.get("name", ""),
             "url": page_url,
             "verified": raw_profile.get("verified", False),
-            "follower_count": raw_profile.get("followersCount", raw_profile.get("likes", 0)),
+            "follower_count": first_of(raw_profile, ("followersCount", "likes"), 0),
             "following_count": None  # Facebook often doesn't provide this
         }
     
@@ -29,6 +29,9 @@ class CollectorFactory:
         "instagram": InstagramCollector
     }
     
+    # Collector instances, created once per platform and reused across tasks
+    _instances: Dict[str, BaseCollector] = {}
+    
     @classmethod
     def register_collector(cls, platform: str, collector_class: Type[BaseCollector]) -> None:
         """
@@ -45,6 +48,8 @@ class CollectorFactory:
             raise ValueError(f"Collector class must be a subclass of BaseCollector, got {collector_class}")
         
         cls._registry[platform.lower()] = collector_class
+        # Drop any instance of a previously registered collector
+        cls._instances.pop(platform.lower(), None)
         logger.info(f"Registered collector for platform: {platform}")
     
     @classmethod
@@ -52,6 +57,8 @@ class CollectorFactory:
         """
         Get a collector instance for the specified platform.
         
+        The instance is created on first use and shared by later calls.
+        
         Args:
             platform: Name of the platform (e.g., "twitter", "facebook")
             
@@ -63,12 +70,28 @@ class CollectorFactory:
         """
         platform = platform.lower()
         
+        collector = cls._instances.get(platform)
+        if collector is not None:
+            return collector
+        
         if platform not in cls._registry:
             supported = ", ".join(cls._registry.keys())
             raise ValueError(f"No collector registered for platform: {platform}. Supported platforms: {supported}")
         
-        collector_class = cls._registry[platform]
-        return collector_class()
+        collector = cls._registry[platform]()
+        cls._instances[platform] = collector
+        return collector
+    
+    @classmethod
+    def initialize_collectors(cls) -> None:
+        """
+        Create a collector instance for every registered platform up front.
+        
+        Called at application startup so the first task for each platform
+        doesn't pay for creating its collector.
+        """
+        for platform in cls._registry:
+            cls.get_collector(platform)
     
     @classmethod
     def list_supported_platforms(cls) -> list[str]:
@@ -91,4 +114,5 @@ class CollectorFactory:
         Returns:
             True if the platform is supported, False otherwise
         """
-        return platform.lower() in cls._registry 
\ No newline at end of file
+        return platform.lower() in cls._registry
+
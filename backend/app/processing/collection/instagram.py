@@ -6,7 +6,7 @@ This module provides a collector for Instagram data using APIFY's Instagram Scra
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from app.core.config import settings
@@ -16,6 +16,11 @@ from app.services.repositories.social_media_account import SocialMediaAccountRep
 
 logger = logging.getLogger(__name__)
 
+# Time allowed for a batch actor run to finish: the usual single-account
+# wait plus a share for every account in the batch (seconds)
+BATCH_RUN_BASE_WAIT = 600
+BATCH_RUN_WAIT_PER_ACCOUNT = 30
+
 
 class InstagramCollector(BaseCollector):
     """
@@ -26,6 +31,8 @@ class InstagramCollector(BaseCollector):
     expected by the application's repositories.
     """
     
+    supports_batch_collection = True
+    
     def __init__(self, *args, **kwargs):
         """Initialize the Instagram collector."""
         super().__init__(*args, **kwargs)
@@ -89,7 +96,7 @@ class InstagramCollector(BaseCollector):
             post = collection.find_one({"_id": ObjectId(post_id)})
             return post
         except Exception as e:
-            logger.error(f"Error getting post synchronously: {e}")
+            logger.error("Error getting post synchronously: %s", e)
             return None
         finally:
             client.close()
@@ -116,7 +123,7 @@ class InstagramCollector(BaseCollector):
         max_count = count or self.max_items
         start_date, _ = self.get_default_date_range() if not since_date else (since_date, datetime.utcnow())
         
-        logger.info(f"Collecting posts for Instagram account {handle} (max: {max_count}, since: {start_date})")
+        logger.info("Collecting posts for Instagram account %s (max: %s, since: %s)", handle, max_count, start_date)
         
         # Configure Instagram scraper input
         run_input = self.prepare_run_input(
@@ -134,20 +141,101 @@ class InstagramCollector(BaseCollector):
         )
         
         # Filter for post objects only
-        posts = []
+        posts = [post for _, post in self._iter_posts(results)]
+        
+        logger.info("Collected %d posts for Instagram account %s", len(posts), handle)
+        
+        # Save posts to MongoDB
+        return await self.save_posts(posts, account_id)
+    
+    @staticmethod
+    def _iter_posts(results: List[Dict[str, Any]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield the post objects in an Instagram actor run's results.
+        
+        Args:
+            results: Items returned by the Instagram actor
+            
+        Yields:
+            Tuples of (owner username, raw post)
+        """
         for item in results:
             # Instagram APIFY actor sometimes nests posts inside profile objects
-            if "type" in item and item["type"] == "user":
-                if "latestPosts" in item:
-                    posts.extend(item["latestPosts"])
+            if item.get("type") == "user":
+                for post in item.get("latestPosts", []):
+                    yield post.get("ownerUsername") or item.get("username", ""), post
             else:
                 # Assume it's a post object directly
-                posts.append(item)
+                yield item.get("ownerUsername", ""), item
+    
+    async def collect_posts_batch(
+        self,
+        account_ids: List[Union[UUID, str]],
+        count: int = None,
+        since_date: datetime = None
+    ) -> Dict[str, List[str]]:
+        """
+        Collect posts from several Instagram accounts in a single actor run.
         
-        logger.info(f"Collected {len(posts)} posts for Instagram account {handle}")
+        Args:
+            account_ids: UUIDs of the social media accounts to collect from
+            count: Maximum number of posts to collect per account (defaults to settings.SCRAPING_MAX_POSTS)
+            since_date: Only collect posts after this date (defaults to default date range)
+            
+        Returns:
+            Dictionary mapping each account ID (as a string) to the MongoDB IDs
+            of its collected posts; accounts without a known handle are omitted
+        """
+        # Map handles back to the accounts they belong to
+        accounts_by_handle: Dict[str, Union[UUID, str]] = {}
+        for account_id in account_ids:
+            try:
+                handle = await self._get_account_handle(account_id)
+            except ValueError as e:
+                logger.warning("Skipping account in Instagram batch: %s", e)
+                continue
+            accounts_by_handle[handle.lower()] = account_id
         
-        # Save posts to MongoDB
-        return await self.save_posts(posts, account_id)
+        if not accounts_by_handle:
+            return {}
+        
+        max_count = count or self.max_items
+        start_date, _ = self.get_default_date_range() if not since_date else (since_date, datetime.utcnow())
+        
+        logger.info(
+            "Collecting posts for %d Instagram accounts (max per account: %s, since: %s)",
+            len(accounts_by_handle), max_count, start_date
+        )
+        
+        # One actor run covers every account; maxPosts applies per username
+        run_input = self.prepare_run_input(
+            usernames=list(accounts_by_handle),
+            maxPosts=max_count,
+            resultsType="posts",
+            scrapePostsUntilDate=start_date.strftime("%Y-%m-%d")
+        )
+        
+        results = await self.apify_client.start_and_wait_for_results(
+            actor_id=self.actor_id,
+            run_input=run_input,
+            limit=max_count * len(accounts_by_handle),
+            max_wait_time=BATCH_RUN_BASE_WAIT + BATCH_RUN_WAIT_PER_ACCOUNT * len(accounts_by_handle)
+        )
+        
+        # Group posts by the account that owns them
+        posts_by_handle: Dict[str, List[Dict[str, Any]]] = {handle: [] for handle in accounts_by_handle}
+        for username, post in self._iter_posts(results):
+            posts = posts_by_handle.get(username.lower())
+            if posts is not None:
+                posts.append(post)
+        
+        post_ids_by_account: Dict[str, List[str]] = {}
+        for handle, posts in posts_by_handle.items():
+            account_id = accounts_by_handle[handle]
+            logger.info("Collected %d posts for Instagram account %s", len(posts), handle)
+            post_ids_by_account[str(account_id)] = await self.save_posts(posts, account_id)
+        
+        return post_ids_by_account
     
     async def collect_comments(
         self,
@@ -191,7 +279,7 @@ class InstagramCollector(BaseCollector):
         
         max_count = count or self.max_comments
         
-        logger.info(f"Collecting comments for Instagram post {ig_post_id} (max: {max_count})")
+        logger.info("Collecting comments for Instagram post %s (max: %s)", ig_post_id, max_count)
         
         # Configure Instagram scraper for comments
         run_input = self.prepare_run_input(
@@ -209,14 +297,13 @@ class InstagramCollector(BaseCollector):
         # Extract comments from results
         comments = []
         for item in results:
-            if "type" in item and item["type"] == "post":
-                if "comments" in item:
-                    comments.extend(item["comments"])
+            if item.get("type") == "post":
+                comments.extend(item.get("comments", ()))
             elif "id" in item and "ownerUsername" in item:
                 # This is likely a comment object directly
                 comments.append(item)
         
-        logger.info(f"Collected {len(comments)} comments for Instagram post {ig_post_id}")
+        logger.info("Collected %d comments for Instagram post %s", len(comments), ig_post_id)
         
         # Save comments to MongoDB
         return await self.save_comments(comments, post_id)
@@ -236,7 +323,7 @@ class InstagramCollector(BaseCollector):
         """
         handle = await self._get_account_handle(account_id)
         
-        logger.info(f"Collecting profile information for Instagram account {handle}")
+        logger.info("Collecting profile information for Instagram account %s", handle)
         
         # Configure Instagram scraper for profile
         run_input = self.prepare_run_input(
@@ -253,14 +340,10 @@ class InstagramCollector(BaseCollector):
         )
         
         # Find the profile info object
-        profile_info = None
-        for item in results:
-            if "type" in item and item["type"] == "user":
-                profile_info = item
-                break
+        profile_info = next((item for item in results if item.get("type") == "user"), None)
             
         if not profile_info:
-            logger.warning(f"No profile information returned for Instagram account {handle}")
+            logger.warning("No profile information returned for Instagram account %s", handle)
             return {}
         
         # Transform and update account
@@ -273,7 +356,7 @@ class InstagramCollector(BaseCollector):
         # Now update the account
         await self.account_repository.update(account_id, account_data)
         
-        logger.info(f"Updated profile information for Instagram account {handle}")
+        logger.info("Updated profile information for Instagram account %s", handle)
         return account_data
     
     async def update_metrics(
@@ -295,10 +378,49 @@ class InstagramCollector(BaseCollector):
         # For Instagram, updating metrics is the same as collecting profile
         return await self.collect_profile(account_id)
     
+    def _parse_timestamp(self, timestamp: Union[str, int, float]) -> datetime:
+        """
+        Parse an Instagram timestamp, given either as an ISO 8601 string or
+        as epoch milliseconds.
+        
+        Args:
+            timestamp: Timestamp from the APIFY item
+            
+        Returns:
+            Naive datetime in UTC, matching the datetime.utcnow() fallback
+            
+        Raises:
+            ValueError, TypeError: If the timestamp can't be parsed
+        """
+        if isinstance(timestamp, str):
+            return self.parse_iso_datetime(timestamp)
+        return datetime.utcfromtimestamp(timestamp / 1000)
+    
+    def transform_posts_batch(
+        self,
+        raw_posts: List[Dict[str, Any]],
+        account_id: Union[UUID, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Transform a list of raw Instagram posts from APIFY in one call.
+        
+        Args:
+            raw_posts: Raw post data from APIFY
+            account_id: UUID of the social media account
+            
+        Returns:
+            Transformed post data, in the same order as raw_posts
+        """
+        # Posts without a usable timestamp all fall back to the same time
+        collected_at = datetime.utcnow()
+        transform = self.transform_post
+        return [transform(raw_post, account_id, collected_at) for raw_post in raw_posts]
+    
     def transform_post(
         self,
         raw_post: Dict[str, Any],
-        account_id: Union[UUID, str]
+        account_id: Union[UUID, str],
+        collected_at: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Transform a raw Instagram post from APIFY into the format expected by the repository.
@@ -306,6 +428,8 @@ class InstagramCollector(BaseCollector):
         Args:
             raw_post: Raw post data from APIFY
             account_id: UUID of the social media account
+            collected_at: Creation time to use if the post has no usable timestamp
+                (defaults to now)
             
         Returns:
             Transformed post data
@@ -316,10 +440,10 @@ class InstagramCollector(BaseCollector):
         shortcode = raw_post.get("shortCode", "")
         
         # Extract timestamps
-        created_at = datetime.utcnow()
+        created_at = collected_at or datetime.utcnow()
         if "timestamp" in raw_post:
             try:
-                created_at = datetime.fromtimestamp(raw_post["timestamp"] / 1000)
+                created_at = self._parse_timestamp(raw_post["timestamp"])
             except (ValueError, TypeError):
                 pass
         elif "createdAt" in raw_post:
@@ -511,7 +635,7 @@ class InstagramCollector(BaseCollector):
             elif post and "metadata" in post and "shortcode" in post["metadata"]:
                 post_url = f"https://www.instagram.com/p/{post['metadata']['shortcode']}/"
         except Exception as e:
-            logger.warning(f"Could not fetch parent post for url: {str(e)}")
+            logger.warning("Could not fetch parent post for url: %s", e)
         
         # Extract basic information
         comment_id = raw_comment.get("id", "")
@@ -529,7 +653,7 @@ class InstagramCollector(BaseCollector):
         created_at = datetime.utcnow()
         if "timestamp" in raw_comment:
             try:
-                created_at = datetime.fromtimestamp(raw_comment["timestamp"] / 1000)
+                created_at = self._parse_timestamp(raw_comment["timestamp"])
             except (ValueError, TypeError):
                 pass
         
@@ -547,7 +671,7 @@ class InstagramCollector(BaseCollector):
                     reply_created_at = datetime.utcnow()
                     if "timestamp" in reply:
                         try:
-                            reply_created_at = datetime.fromtimestamp(reply["timestamp"] / 1000)
+                            reply_created_at = self._parse_timestamp(reply["timestamp"])
                         except (ValueError, TypeError):
                             pass
                     
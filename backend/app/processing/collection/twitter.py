@@ -5,7 +5,7 @@ This module provides a collector for Twitter data using APIFY's Twitter Scraper
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
@@ -15,6 +15,9 @@ from app.services.repositories.social_media_account import SocialMediaAccountRep
 
 logger = logging.getLogger(__name__)
 
+# Format of "createdAt" in the tweet scraper's output (e.g. "Wed Mar 26 22:07:45 +0000 2025")
+TWEET_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
 
 class TwitterCollector(BaseCollector):
     """
@@ -228,6 +231,27 @@ class TwitterCollector(BaseCollector):
         # For Twitter, updating metrics is the same as collecting profile
         return await self.collect_profile(account_id)
     
+    def _parse_created_at(self, created_at: str) -> datetime:
+        """
+        Parse a tweet's createdAt timestamp.
+        
+        The tweet scraper uses Twitter's own format (see TWEET_DATE_FORMAT),
+        which is parsed in a single pass; ISO 8601 strings are accepted too.
+        
+        Args:
+            created_at: Timestamp from the APIFY item
+            
+        Returns:
+            Naive datetime in UTC, matching the datetime.utcnow() fallback
+            
+        Raises:
+            ValueError, TypeError: If the timestamp can't be parsed
+        """
+        if created_at[:1].isdigit():
+            return self.parse_iso_datetime(created_at)
+        parsed = datetime.strptime(created_at, TWEET_DATE_FORMAT)
+        return parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    
     def transform_post(
         self,
         raw_post: Dict[str, Any],
@@ -249,19 +273,11 @@ class TwitterCollector(BaseCollector):
         post_url = raw_post.get("url", "")
         
         try:
-            created_at = datetime.strptime(
-                raw_post.get("createdAt", "").split(".")[0], 
-                "%Y-%m-%dT%H:%M:%S"
+            created_at = self._parse_created_at(
+                raw_post["createdAt"]
             ) if "createdAt" in raw_post else datetime.utcnow()
         except (ValueError, TypeError):
-            # Handle alternative date formats
-            try:
-                created_at = datetime.strptime(
-                    raw_post.get("createdAt", "").split("+")[0].strip(), 
-                    "%a %b %d %H:%M:%S %Y"
-                )
-            except (ValueError, TypeError):
-                created_at = datetime.utcnow()
+            created_at = datetime.utcnow()
         
         # Extract media and links
         media_urls = []
@@ -493,19 +509,11 @@ class TwitterCollector(BaseCollector):
         
         # Parse created_at date
         try:
-            created_at = datetime.strptime(
-                raw_comment.get("createdAt", "").split(".")[0], 
-                "%Y-%m-%dT%H:%M:%S"
+            created_at = self._parse_created_at(
+                raw_comment["createdAt"]
             ) if "createdAt" in raw_comment else datetime.utcnow()
         except (ValueError, TypeError):
-            # Handle alternative date formats
-            try:
-                created_at = datetime.strptime(
-                    raw_comment.get("createdAt", "").split("+")[0].strip(), 
-                    "%a %b %d %H:%M:%S %Y"
-                )
-            except (ValueError, TypeError):
-                created_at = datetime.utcnow()
+            created_at = datetime.utcnow()
         
         # Extract media
         media_urls = []
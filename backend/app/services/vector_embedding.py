@@ -11,7 +11,7 @@ import logging
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 import backoff
@@ -26,6 +26,46 @@ from app.db.connections import get_pinecone
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of input tokens accepted by OpenAI embedding models
+MAX_EMBEDDING_TOKENS = 8191
+
+# tiktoken encodings, loaded lazily once per model name
+_token_encodings: Dict[str, Any] = {}
+
+
+def _get_token_encoding(model_name: str) -> Optional[Any]:
+    """
+    Get the tiktoken encoding for an embedding model.
+    
+    Args:
+        model_name: Name of the OpenAI embedding model.
+        
+    Returns:
+        The tiktoken encoding, or None if tiktoken is not installed or the
+        encoding can't be loaded.
+    """
+    if model_name not in _token_encodings:
+        try:
+            import tiktoken
+            
+            try:
+                encoding = tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                # Unknown model names fall back to the embedding models' encoding
+                encoding = tiktoken.get_encoding("cl100k_base")
+        except ImportError as e:
+            logger.warning(f"tiktoken package not available - skipping token pre-flight: {str(e)}")
+            encoding = None
+        except Exception as e:
+            # tiktoken downloads the encoding on first use; the pre-flight is
+            # optional, so a failed download must not fail the embedding call
+            logger.warning(f"Could not load tiktoken encoding - skipping token pre-flight: {str(e)}")
+            encoding = None
+        
+        _token_encodings[model_name] = encoding
+    
+    return _token_encodings[model_name]
+
 
 class VectorEmbeddingService:
     """
@@ -73,6 +113,32 @@ class VectorEmbeddingService:
         if not self._openai_client:
             logger.warning("OpenAI API key not provided - embedding generation will be disabled")
     
+    def _truncate_to_token_limit(self, text: str) -> str:
+        """
+        Truncate text that exceeds the embedding model's input token limit.
+        
+        Over-long inputs are rejected by OpenAI only after the round-trip, so
+        they are cut down locally before being sent.
+        
+        Args:
+            text: The text to check.
+            
+        Returns:
+            The text, truncated to MAX_EMBEDDING_TOKENS tokens if necessary.
+        """
+        encoding = _get_token_encoding(self._model_name)
+        if encoding is None:
+            return text
+        
+        tokens = encoding.encode(text)
+        if len(tokens) <= MAX_EMBEDDING_TOKENS:
+            return text
+        
+        logger.warning(
+            f"Truncating embedding input from {len(tokens)} to {MAX_EMBEDDING_TOKENS} tokens"
+        )
+        return encoding.decode(tokens[:MAX_EMBEDDING_TOKENS])
+    
     @backoff.on_exception(
         backoff.expo,
         OpenAIError,
@@ -106,7 +172,7 @@ class VectorEmbeddingService:
             # Call OpenAI API to get embedding
             response = await self._openai_client.embeddings.create(
                 model=self._model_name,
-                input=text,
+                input=self._truncate_to_token_limit(text),
                 encoding_format="float"
             )
             
@@ -123,6 +189,69 @@ class VectorEmbeddingService:
         max_tries=5,
         jitter=backoff.full_jitter
     )
+    async def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for a single API-sized batch of non-empty texts.
+        
+        Args:
+            texts: Non-empty texts to embed in a single OpenAI request.
+            
+        Returns:
+            Matrix of shape (len(texts), dimension) with one embedding per row.
+            
+        Raises:
+            OpenAIError: If there's an error from the OpenAI API.
+            ValueError: If OpenAI client is not initialized.
+        """
+        if not self._openai_client:
+            logger.error("OpenAI client not initialized - cannot generate embeddings")
+            raise ValueError("OpenAI client not initialized. Please provide an API key.")
+        
+        try:
+            response = await self._openai_client.embeddings.create(
+                model=self._model_name,
+                input=texts,
+                encoding_format="float"
+            )
+            return np.array([data.embedding for data in response.data])
+        except OpenAIError as e:
+            logger.error(f"Error generating batch embeddings with OpenAI: {str(e)}")
+            raise
+    
+    async def iter_embeddings(
+        self,
+        texts: List[str]
+    ) -> AsyncIterator[Tuple[int, np.ndarray]]:
+        """
+        Generate embeddings batch by batch, yielding each batch as soon as it lands.
+        
+        Lets callers start storing the first batches while later ones are still
+        being generated, instead of waiting for the whole input to be embedded.
+        
+        Args:
+            texts: List of texts to generate embeddings for.
+            
+        Yields:
+            Tuples of (start index into ``texts``, matrix of embeddings for the
+            batch). Empty texts get zero vectors.
+            
+        Raises:
+            OpenAIError: If there's an error from the OpenAI API.
+        """
+        for start in range(0, len(texts), self._batch_size):
+            batch_texts = texts[start:start + self._batch_size]
+            
+            # Only send non-empty texts to OpenAI; empty ones keep zero rows
+            non_empty_positions = [j for j, text in enumerate(batch_texts) if text.strip()]
+            batch_matrix = np.zeros((len(batch_texts), self._vector_dimension))
+            
+            if non_empty_positions:
+                batch_matrix[non_empty_positions] = await self._embed_texts(
+                    [self._truncate_to_token_limit(batch_texts[j]) for j in non_empty_positions]
+                )
+            
+            yield start, batch_matrix
+    
     async def generate_embeddings_batch(
         self,
         texts: List[str]
@@ -139,60 +268,10 @@ class VectorEmbeddingService:
         Raises:
             OpenAIError: If there's an error from the OpenAI API.
         """
-        if not texts:
-            return []
+        all_embeddings: List[np.ndarray] = []
         
-        # Process in batches to respect OpenAI API limits
-        all_embeddings = []
-        
-        for i in range(0, len(texts), self._batch_size):
-            batch_texts = texts[i:i + self._batch_size]
-            
-            # Filter out empty texts and create a mapping to track their positions
-            non_empty_texts = []
-            empty_indices = []
-            
-            for j, text in enumerate(batch_texts):
-                if text.strip():
-                    non_empty_texts.append(text)
-                else:
-                    empty_indices.append(j)
-            
-            # If all texts in the batch are empty, add zero vectors and continue
-            if not non_empty_texts:
-                all_embeddings.extend([np.zeros(self._vector_dimension) for _ in batch_texts])
-                continue
-            
-            try:
-                # Call OpenAI API to get embeddings for non-empty texts
-                response = await self._openai_client.embeddings.create(
-                    model=self._model_name,
-                    input=non_empty_texts,
-                    encoding_format="float"
-                )
-                
-                # Extract embeddings from response
-                batch_embeddings = [np.array(data.embedding) for data in response.data]
-                
-                # Reinsert zero vectors for empty texts
-                if empty_indices:
-                    full_batch_embeddings = []
-                    non_empty_idx = 0
-                    
-                    for j in range(len(batch_texts)):
-                        if j in empty_indices:
-                            full_batch_embeddings.append(np.zeros(self._vector_dimension))
-                        else:
-                            full_batch_embeddings.append(batch_embeddings[non_empty_idx])
-                            non_empty_idx += 1
-                    
-                    all_embeddings.extend(full_batch_embeddings)
-                else:
-                    all_embeddings.extend(batch_embeddings)
-                
-            except OpenAIError as e:
-                logger.error(f"Error generating batch embeddings with OpenAI: {str(e)}")
-                raise
+        async for _, batch_matrix in self.iter_embeddings(texts):
+            all_embeddings.extend(batch_matrix)
         
         return all_embeddings
     
@@ -203,7 +282,8 @@ class VectorEmbeddingService:
         account_id: Optional[Union[UUID, str]] = None,
         platform: Optional[str] = None,
         created_at: Optional[datetime] = None,
-        additional_metadata: Optional[Dict[str, Any]] = None
+        additional_metadata: Optional[Dict[str, Any]] = None,
+        indexed_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Prepare metadata for storing with the vector embedding.
@@ -215,6 +295,8 @@ class VectorEmbeddingService:
             platform: Optional social media platform name.
             created_at: Optional timestamp of when the content was created.
             additional_metadata: Optional additional metadata to include.
+            indexed_at: Optional precomputed ISO timestamp for the indexing time.
+                        If None, the current UTC time is used.
             
         Returns:
             Dictionary of metadata suitable for storage in Pinecone.
@@ -222,7 +304,7 @@ class VectorEmbeddingService:
         metadata = {
             "content_type": content_type,
             "content_id": str(content_id),
-            "indexed_at": datetime.utcnow().isoformat()
+            "indexed_at": indexed_at or datetime.utcnow().isoformat()
         }
         
         if account_id:
@@ -362,6 +444,9 @@ class VectorEmbeddingService:
         
         vectors = []
         
+        # All vectors in one batch call share the same indexing timestamp
+        indexed_at = datetime.utcnow().isoformat()
+        
         # Prepare vectors and metadata
         for (
             vector_id,
@@ -379,7 +464,8 @@ class VectorEmbeddingService:
                 account_id=account_id,
                 platform=platform,
                 created_at=created_at,
-                additional_metadata=additional_metadata
+                additional_metadata=additional_metadata,
+                indexed_at=indexed_at
             )
             
             # Convert numpy array to list for Pinecone
@@ -413,6 +499,85 @@ class VectorEmbeddingService:
         
         return total_stored
     
+    async def embed_and_upsert(
+        self,
+        items: List[Tuple[
+            str,                # vector_id
+            str,                # text
+            str,                # content_type
+            str,                # content_id
+            Optional[Union[UUID, str]],  # account_id
+            Optional[str],      # platform
+            Optional[datetime], # created_at
+            Optional[Dict[str, Any]]  # additional_metadata
+        ]],
+        namespace: str = "",
+        queue_size: int = 4
+    ) -> int:
+        """
+        Generate embeddings and store them in Pinecone as a single pipeline.
+        
+        Embedding generation and Pinecone upserts run in two coroutines connected
+        by a bounded queue, so the upsert of one batch overlaps with the OpenAI
+        request for the next one.
+        
+        Args:
+            items: List of tuples containing the text and metadata for each vector.
+            namespace: Optional namespace to store the vectors in.
+            queue_size: Maximum number of embedded batches waiting to be stored.
+            
+        Returns:
+            Number of successfully stored embeddings.
+            
+        Raises:
+            OpenAIError: If there's an error from the OpenAI API.
+            Exception: If there's an error from the Pinecone API.
+        """
+        if not items:
+            return 0
+        
+        if not self._pinecone_available or not self._pinecone_index:
+            logger.error("Pinecone not available - cannot store embeddings")
+            return 0
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        
+        async def produce() -> None:
+            texts = [item[1] for item in items]
+            async for start, batch_matrix in self.iter_embeddings(texts):
+                await queue.put((start, batch_matrix))
+            # Sentinel telling the consumer that generation is finished
+            await queue.put(None)
+        
+        async def consume() -> int:
+            stored = 0
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    return stored
+                
+                start, batch_matrix = entry
+                batch_items = items[start:start + len(batch_matrix)]
+                embedding_data = [
+                    (item[0], embedding, *item[2:])
+                    for item, embedding in zip(batch_items, batch_matrix)
+                ]
+                stored += await self.store_embeddings_batch(embedding_data, namespace=namespace)
+        
+        producer = asyncio.create_task(produce())
+        consumer = asyncio.create_task(consume())
+        
+        try:
+            _, total_stored = await asyncio.gather(producer, consumer)
+        except BaseException:
+            # Don't leave the other side blocked on the queue
+            producer.cancel()
+            consumer.cancel()
+            raise
+        
+        logger.debug(f"Embedded and stored {total_stored} vectors")
+        return total_stored
+    
     @backoff.on_exception(
         backoff.expo,
         Exception,
@@ -7,6 +7,7 @@ from app.tasks.worker import (
 )
 from app.tasks.task_manager import TaskManager, task_manager
 from app.tasks.task_types import (
+    TaskStatus,
     TaskType,
 )
 
@@ -21,5 +22,6 @@ __all__ = [
     # MVP Task Manager components
     "TaskManager",
     "task_manager",
+    "TaskStatus",
     "TaskType",
 ] 
\ No newline at end of file
@@ -5,17 +5,83 @@ This module provides task functions for social media data collection
 using the platform-specific collectors from the APIFY API.
 """
 
+import asyncio
+import functools
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 from uuid import UUID
 
+from app.processing.collection.base import BaseCollector
 from app.processing.collection.factory import CollectorFactory
+from app.tasks.rate_limits import get_concurrency_limiter, get_rate_limiter
 from app.tasks.task_types import TaskResult
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
+# Maximum number of accounts submitted to a single batch actor run; the
+# run's wait time grows with it, so keep chunks small enough to finish
+POST_BATCH_MAX_ACCOUNTS = 200
+
+
+def timed_task(task_func: Callable[..., Awaitable[TaskResult]]) -> Callable[..., Awaitable[TaskResult]]:
+    """
+    Decorate a task function to record its timing in the returned TaskResult.
+    
+    Adds ``started_at``, ``completed_at`` and ``duration_seconds`` to the
+    result, so task functions only report their outcome.
+    
+    Args:
+        task_func: Async task function returning a TaskResult
+        
+    Returns:
+        The wrapped task function
+    """
+    @functools.wraps(task_func)
+    async def wrapper(*args: Any, **kwargs: Any) -> TaskResult:
+        started_at = datetime.utcnow()
+        start_clock = time.perf_counter()
+        
+        result = await task_func(*args, **kwargs)
+        
+        duration_seconds = time.perf_counter() - start_clock
+        result.duration_seconds = duration_seconds
+        result.started_at = started_at
+        # Derive the end time from the monotonic duration instead of reading the clock again
+        result.completed_at = started_at + timedelta(seconds=duration_seconds)
+        logger.info("Task %s finished in %.2f seconds", task_func.__name__, duration_seconds)
+        return result
+    
+    return wrapper
+
+
+async def _collect_rate_limited(
+    platform: str,
+    collect: Callable[..., Awaitable[T]],
+    **kwargs: Any
+) -> T:
+    """
+    Call a collector method under the platform's rate limiter.
+    
+    Failed collector calls are not retried here: a call can start a paid
+    actor run, and ApifyClient already retries each failed APIFY request.
+    
+    Args:
+        platform: Social media platform the collector belongs to
+        collect: Collector method to call
+        **kwargs: Arguments for the collector method
+        
+    Returns:
+        The collector method's result
+    """
+    async with get_rate_limiter(platform):
+        return await collect(**kwargs)
+
+
+@timed_task
 async def scrape_account_posts(
     account_id: Union[UUID, str],
     platform: str,
@@ -36,54 +102,45 @@ async def scrape_account_posts(
     Returns:
         TaskResult containing collected post IDs or error information
     """
-    start_time = datetime.utcnow()
-    logger.info(f"Starting post collection task for {platform} account {account_id}")
+    logger.info("Starting post collection task for %s account %s", platform, account_id)
     
     try:
         # Get the appropriate collector for the platform
         collector = CollectorFactory.get_collector(platform)
         
         # Collect posts
-        post_ids = await collector.collect_posts(
+        post_ids = await _collect_rate_limited(
+            platform,
+            collector.collect_posts,
             account_id=account_id,
             count=count,
             since_date=since_date
         )
         
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
-        
-        logger.info(f"Completed post collection task for {platform} account {account_id}, collected {len(post_ids)} posts in {duration:.2f} seconds")
+        logger.info(
+            "Completed post collection task for %s account %s, collected %d posts",
+            platform, account_id, len(post_ids)
+        )
         
-        return {
-            "success": True,
-            "data": {
+        return TaskResult(
+            success=True,
+            data={
                 "platform": platform,
-                "account_id": str(account_id),
+                "account_id": account_id,
                 "post_count": len(post_ids),
-                "post_ids": post_ids
-            },
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+                "post_ids": tuple(post_ids)
+            }
+        )
         
     except Exception as e:
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
         error_message = f"Error collecting posts for {platform} account {account_id}: {str(e)}"
         
         logger.error(error_message, exc_info=True)
         
-        return {
-            "success": False,
-            "error": error_message,
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+        return TaskResult(success=False, error=error_message)
 
 
+@timed_task
 async def scrape_post_comments(
     post_id: str,
     platform: str,
@@ -102,53 +159,44 @@ async def scrape_post_comments(
     Returns:
         TaskResult containing collected comment IDs or error information
     """
-    start_time = datetime.utcnow()
-    logger.info(f"Starting comment collection task for {platform} post {post_id}")
+    logger.info("Starting comment collection task for %s post %s", platform, post_id)
     
     try:
         # Get the appropriate collector for the platform
         collector = CollectorFactory.get_collector(platform)
         
         # Collect comments
-        comment_ids = await collector.collect_comments(
+        comment_ids = await _collect_rate_limited(
+            platform,
+            collector.collect_comments,
             post_id=post_id,
             count=count
         )
         
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
-        
-        logger.info(f"Completed comment collection task for {platform} post {post_id}, collected {len(comment_ids)} comments in {duration:.2f} seconds")
+        logger.info(
+            "Completed comment collection task for %s post %s, collected %d comments",
+            platform, post_id, len(comment_ids)
+        )
         
-        return {
-            "success": True,
-            "data": {
+        return TaskResult(
+            success=True,
+            data={
                 "platform": platform,
                 "post_id": post_id,
                 "comment_count": len(comment_ids),
-                "comment_ids": comment_ids
-            },
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+                "comment_ids": tuple(comment_ids)
+            }
+        )
         
     except Exception as e:
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
         error_message = f"Error collecting comments for {platform} post {post_id}: {str(e)}"
         
         logger.error(error_message, exc_info=True)
         
-        return {
-            "success": False,
-            "error": error_message,
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+        return TaskResult(success=False, error=error_message)
 
 
+@timed_task
 async def update_account_profile(
     account_id: Union[UUID, str],
     platform: str,
@@ -165,49 +213,39 @@ async def update_account_profile(
     Returns:
         TaskResult containing updated profile data or error information
     """
-    start_time = datetime.utcnow()
-    logger.info(f"Starting profile update task for {platform} account {account_id}")
+    logger.info("Starting profile update task for %s account %s", platform, account_id)
     
     try:
         # Get the appropriate collector for the platform
         collector = CollectorFactory.get_collector(platform)
         
         # Update profile
-        profile_data = await collector.collect_profile(account_id=account_id)
-        
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
+        profile_data = await _collect_rate_limited(
+            platform,
+            collector.collect_profile,
+            account_id=account_id
+        )
         
-        logger.info(f"Completed profile update task for {platform} account {account_id} in {duration:.2f} seconds")
+        logger.info("Completed profile update task for %s account %s", platform, account_id)
         
-        return {
-            "success": True,
-            "data": {
+        return TaskResult(
+            success=True,
+            data={
                 "platform": platform,
-                "account_id": str(account_id),
+                "account_id": account_id,
                 "profile_data": profile_data
-            },
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+            }
+        )
         
     except Exception as e:
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
         error_message = f"Error updating profile for {platform} account {account_id}: {str(e)}"
         
         logger.error(error_message, exc_info=True)
         
-        return {
-            "success": False,
-            "error": error_message,
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+        return TaskResult(success=False, error=error_message)
 
 
+@timed_task
 async def update_account_metrics(
     account_id: Union[UUID, str],
     platform: str,
@@ -224,140 +262,219 @@ async def update_account_metrics(
     Returns:
         TaskResult containing updated metrics data or error information
     """
-    start_time = datetime.utcnow()
-    logger.info(f"Starting metrics update task for {platform} account {account_id}")
+    logger.info("Starting metrics update task for %s account %s", platform, account_id)
     
     try:
         # Get the appropriate collector for the platform
         collector = CollectorFactory.get_collector(platform)
         
         # Update metrics
-        metrics_data = await collector.update_metrics(account_id=account_id)
-        
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
+        metrics_data = await _collect_rate_limited(
+            platform,
+            collector.update_metrics,
+            account_id=account_id
+        )
         
-        logger.info(f"Completed metrics update task for {platform} account {account_id} in {duration:.2f} seconds")
+        logger.info("Completed metrics update task for %s account %s", platform, account_id)
         
-        return {
-            "success": True,
-            "data": {
+        return TaskResult(
+            success=True,
+            data={
                 "platform": platform,
-                "account_id": str(account_id),
+                "account_id": account_id,
                 "metrics_data": metrics_data
-            },
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+            }
+        )
         
     except Exception as e:
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
         error_message = f"Error updating metrics for {platform} account {account_id}: {str(e)}"
         
         logger.error(error_message, exc_info=True)
         
-        return {
-            "success": False,
-            "error": error_message,
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+        return TaskResult(success=False, error=error_message)
 
 
+async def _scrape_in_batches(
+    collector: BaseCollector,
+    platform: str,
+    account_ids: List[Union[UUID, str]],
+    count_per_account: Optional[int],
+    since_date: Optional[datetime],
+    semaphore: asyncio.Semaphore
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect posts for many accounts through the collector's batch interface.
+    
+    Accounts are split into chunks of up to POST_BATCH_MAX_ACCOUNTS, one
+    actor run each; every run holds a slot of the semaphore while it's
+    in flight.
+    
+    Args:
+        collector: Platform collector to use, supporting batch collection
+        platform: Social media platform (twitter, facebook, instagram)
+        account_ids: List of UUIDs of social media accounts to collect from
+        count_per_account: Maximum number of posts to collect per account
+        since_date: Only collect posts after this date
+        semaphore: Limits the number of actor runs in flight
+        
+    Returns:
+        Per-account results keyed by account ID
+    """
+    async def scrape_chunk(chunk: List[Union[UUID, str]]) -> Dict[str, Dict[str, Any]]:
+        error_message = None
+        
+        async with semaphore:
+            try:
+                post_ids_by_account = await _collect_rate_limited(
+                    platform,
+                    collector.collect_posts_batch,
+                    account_ids=chunk,
+                    count=count_per_account,
+                    since_date=since_date
+                )
+            except Exception as e:
+                # Record failure for every account in this chunk but continue with others
+                error_message = f"Error collecting posts for batch of {len(chunk)} {platform} accounts: {str(e)}"
+                logger.error(error_message, exc_info=logger.isEnabledFor(logging.DEBUG))
+                post_ids_by_account = {}
+        
+        chunk_results: Dict[str, Dict[str, Any]] = {}
+        for account_id in chunk:
+            post_ids = post_ids_by_account.get(str(account_id))
+            if post_ids is None:
+                chunk_results[str(account_id)] = {
+                    "success": False,
+                    "error": error_message or f"No posts collected for {platform} account {account_id}"
+                }
+            else:
+                chunk_results[str(account_id)] = {
+                    "success": True,
+                    "post_count": len(post_ids)
+                }
+        return chunk_results
+    
+    chunks = [
+        account_ids[start:start + POST_BATCH_MAX_ACCOUNTS]
+        for start in range(0, len(account_ids), POST_BATCH_MAX_ACCOUNTS)
+    ]
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    for chunk_results in await asyncio.gather(*(scrape_chunk(chunk) for chunk in chunks)):
+        results.update(chunk_results)
+    return results
+
+
+@timed_task
 async def batch_scrape_accounts(
     account_ids: List[Union[UUID, str]],
     platform: str,
     count_per_account: Optional[int] = None,
     since_date: Optional[datetime] = None,
+    concurrency: Optional[int] = None,
     **kwargs
 ) -> TaskResult:
     """
     Task to batch scrape posts from multiple social media accounts.
     
+    If the platform's collector supports batch collection, accounts are
+    submitted in actor runs of up to POST_BATCH_MAX_ACCOUNTS accounts.
+    Otherwise accounts are collected one call each. Either way the calls
+    run concurrently; unless ``concurrency`` is given, the number of calls
+    in flight is capped by the platform's shared concurrency limit.
+    
     Args:
         account_ids: List of UUIDs of social media accounts to collect from
         platform: Social media platform (twitter, facebook, instagram)
         count_per_account: Maximum number of posts to collect per account
         since_date: Only collect posts after this date
+        concurrency: Optional maximum number of accounts to collect from at once
         **kwargs: Additional platform-specific parameters
         
     Returns:
-        TaskResult containing collected post IDs by account or error information
+        TaskResult containing post counts by account or error information
     """
-    start_time = datetime.utcnow()
-    logger.info(f"Starting batch post collection task for {len(account_ids)} {platform} accounts")
+    logger.info("Starting batch post collection task for %d %s accounts", len(account_ids), platform)
     
     try:
         # Get the appropriate collector for the platform
         collector = CollectorFactory.get_collector(platform)
         
-        results = {}
-        for account_id in account_ids:
-            try:
-                # Collect posts for this account
-                post_ids = await collector.collect_posts(
-                    account_id=account_id,
-                    count=count_per_account,
-                    since_date=since_date
-                )
-                
-                # Store results
-                results[str(account_id)] = {
-                    "success": True,
-                    "post_count": len(post_ids),
-                    "post_ids": post_ids
-                }
-                
-            except Exception as e:
-                # Record failure for this account but continue with others
-                error_message = f"Error collecting posts for {platform} account {account_id}: {str(e)}"
-                logger.error(error_message)
-                
-                results[str(account_id)] = {
-                    "success": False,
-                    "error": error_message
-                }
-        
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
+        if concurrency is None:
+            semaphore = get_concurrency_limiter(platform)
+        else:
+            semaphore = asyncio.Semaphore(concurrency)
+        
+        async def scrape_one(account_id: Union[UUID, str]) -> Tuple[str, Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    # Collect posts for this account
+                    post_ids = await _collect_rate_limited(
+                        platform,
+                        collector.collect_posts,
+                        account_id=account_id,
+                        count=count_per_account,
+                        since_date=since_date
+                    )
+                    
+                    # Posts are already saved by the collector; keep only the count
+                    # so the ID list can be freed as soon as this account is done
+                    result = {
+                        "success": True,
+                        "post_count": len(post_ids)
+                    }
+                    
+                except Exception as e:
+                    # Record failure for this account but continue with others
+                    error_message = f"Error collecting posts for {platform} account {account_id}: {str(e)}"
+                    # Per-account failures don't fail the batch; keep tracebacks for debugging
+                    logger.error(error_message, exc_info=logger.isEnabledFor(logging.DEBUG))
+                    
+                    result = {
+                        "success": False,
+                        "error": error_message
+                    }
+            
+            # Collector calls that complete without suspending would otherwise
+            # let a large batch run without giving other coroutines a turn
+            await asyncio.sleep(0)
+            return str(account_id), result
+        
+        if collector.supports_batch_collection:
+            results = await _scrape_in_batches(
+                collector, platform, account_ids, count_per_account, since_date, semaphore
+            )
+        else:
+            # Collect from all accounts concurrently, bounded by the semaphore,
+            # recording each account as soon as it finishes
+            results = {}
+            for next_done in asyncio.as_completed([scrape_one(account_id) for account_id in account_ids]):
+                account_key, result = await next_done
+                results[account_key] = result
+                logger.debug("Batch post collection finished account %s: %s", account_key, result)
         
         # Count successes and failures
         success_count = sum(1 for r in results.values() if r.get("success", False))
         post_count = sum(r.get("post_count", 0) for r in results.values() if r.get("success", False))
         
         logger.info(
-            f"Completed batch post collection task: {success_count}/{len(account_ids)} accounts succeeded, "
-            f"collected {post_count} posts in {duration:.2f} seconds"
+            "Completed batch post collection task: %d/%d accounts succeeded, collected %d posts",
+            success_count, len(account_ids), post_count
         )
         
-        return {
-            "success": True,
-            "data": {
+        return TaskResult(
+            success=True,
+            data={
                 "platform": platform,
                 "account_count": len(account_ids),
                 "success_count": success_count,
                 "post_count": post_count,
                 "results_by_account": results
-            },
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        }
+            }
+        )
         
     except Exception as e:
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
         error_message = f"Error in batch collection task: {str(e)}"
         
         logger.error(error_message, exc_info=True)
         
-        return {
-            "success": False,
-            "error": error_message,
-            "started_at": start_time,
-            "completed_at": end_time,
-            "duration_seconds": duration
-        } 
\ No newline at end of file
+        return TaskResult(success=False, error=error_message) 
\ No newline at end of file
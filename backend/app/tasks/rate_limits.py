@@ -0,0 +1,130 @@
+"""
+Rate Limits
+
+This module provides client-side rate limiters for the collection tasks,
+so batch operations smooth their APIFY traffic instead of running into
+429 responses and retry storms.
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for use with ``async with``.
+
+    Allows bursts of up to ``max_rate`` acquisitions and refills
+    continuously at ``max_rate`` tokens per ``time_period`` seconds.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_rate: Maximum number of acquisitions allowed per time period
+            time_period: Length of the time period in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens_per_second = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.max_rate, self._tokens + elapsed * self._tokens_per_second)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._tokens_per_second)
+                self._refill()
+
+            self._tokens -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+# Requests per minute allowed towards each platform's collectors
+PLATFORM_RATE_LIMITS: Dict[str, int] = {
+    "twitter": 20,
+    "facebook": 60,
+    "instagram": 100,
+    "tiktok": 60,
+}
+
+DEFAULT_RATE_LIMIT = 20
+
+LIMITERS: Dict[str, AsyncRateLimiter] = {
+    platform: AsyncRateLimiter(rate, 60) for platform, rate in PLATFORM_RATE_LIMITS.items()
+}
+
+
+# Maximum number of collector calls in flight at once for each platform
+PLATFORM_CONCURRENCY: Dict[str, int] = {
+    "twitter": 5,
+    "facebook": 10,
+    "instagram": 20,
+    "tiktok": 10,
+}
+
+DEFAULT_CONCURRENCY = 5
+
+SEMAPHORES: Dict[str, asyncio.Semaphore] = {}
+
+
+def get_rate_limiter(platform: str) -> AsyncRateLimiter:
+    """
+    Get the shared rate limiter for a platform.
+
+    Args:
+        platform: Name of the platform (e.g., "twitter", "facebook")
+
+    Returns:
+        The platform's rate limiter, created with the default rate if the
+        platform has no preset
+    """
+    platform = platform.lower()
+
+    if platform not in LIMITERS:
+        LIMITERS[platform] = AsyncRateLimiter(DEFAULT_RATE_LIMIT, 60)
+
+    return LIMITERS[platform]
+
+
+def get_concurrency_limiter(platform: str) -> asyncio.Semaphore:
+    """
+    Get the shared concurrency limiter for a platform.
+
+    All batches for the same platform share one semaphore, so concurrent
+    batches can't multiply the number of calls in flight.
+
+    Args:
+        platform: Name of the platform (e.g., "twitter", "facebook")
+
+    Returns:
+        Semaphore sized from the platform's concurrency preset
+    """
+    platform = platform.lower()
+
+    if platform not in SEMAPHORES:
+        SEMAPHORES[platform] = asyncio.Semaphore(
+            PLATFORM_CONCURRENCY.get(platform, DEFAULT_CONCURRENCY)
+        )
+
+    return SEMAPHORES[platform]
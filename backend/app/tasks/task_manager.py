@@ -1,16 +1,285 @@
 import uuid
 import asyncio
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import logging
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Callable, Coroutine, Dict, List, Optional
 
-from .task_types import TaskType
+import orjson
+from redis.exceptions import WatchError
+
+from app.core.config import settings
+from app.db.connections import get_redis
+from app.db.schemas.redis_schemas import KeyPatterns
+from .task_types import TaskStatus, TaskType
+
+logger = logging.getLogger(__name__)
+
+# Statuses of tasks that will not change anymore
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED)
+
+# Task results hold naive UTC datetimes (e.g. from collection tasks); mark them
+# as UTC when encoding. UUIDs and datetimes are serialized natively.
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+# Task fields holding datetimes, restored from their ISO form when read from Redis
+_DATETIME_FIELDS = ("created_at", "updated_at")
 
-class TaskManager:
-    """Manages tasks in memory for the MVP."""
+
+class InMemoryTaskStore:
+    """
+    Keeps task state in a process-local dict (MVP default).
+
+    No lock is needed: each method runs without awaiting, so on the single
+    event loop it can't be interleaved with another coroutine.
+    """
 
     def __init__(self):
         self.tasks: Dict[str, Dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+
+    async def create(self, task_data: Dict[str, Any]) -> None:
+        """Stores a new task entry."""
+        self.tasks[task_data["id"]] = task_data
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieves a task entry, or None if it doesn't exist."""
+        return self.tasks.get(task_id)
+
+    async def update(self, task_id: str, fields: Dict[str, Any]) -> bool:
+        """Updates fields of an existing task entry."""
+        if task_id in self.tasks:
+            self.tasks[task_id].update(fields)
+            return True
+        return False
+
+    async def list(
+        self, status: Optional[TaskStatus] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Lists task entries, newest first."""
+        # Dicts keep insertion order, which is creation order, so no sort is needed
+        matching = (
+            task for task in reversed(self.tasks.values())
+            if status is None or task["status"] == status
+        )
+        return list(islice(matching, offset, offset + limit))
+
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        """Deletes finished task entries last updated before the cutoff."""
+        stale_ids = [
+            task_id for task_id, task in self.tasks.items()
+            if task["status"] in FINISHED_STATUSES and task["updated_at"] < cutoff
+        ]
+        for task_id in stale_ids:
+            del self.tasks[task_id]
+        return len(stale_ids)
+
+
+class RedisTaskStore:
+    """
+    Keeps task state in Redis, one hash per task, so it is shared across
+    workers and survives restarts. Entries expire after ``ttl_seconds``.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return KeyPatterns.TASK.format(task_id=task_id)
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, bytes]:
+        return {
+            name: orjson.dumps(value, option=_ORJSON_OPTIONS)
+            for name, value in fields.items()
+        }
+
+    @staticmethod
+    def _decode(raw: Dict[str, str]) -> Dict[str, Any]:
+        task_data = {name: orjson.loads(value) for name, value in raw.items()}
+        for name in _DATETIME_FIELDS:
+            if task_data.get(name):
+                task_data[name] = datetime.fromisoformat(task_data[name])
+        if task_data.get("type"):
+            task_data["type"] = TaskType(task_data["type"])
+        if task_data.get("status"):
+            task_data["status"] = TaskStatus(task_data["status"])
+        return task_data
+
+    async def create(self, task_data: Dict[str, Any]) -> None:
+        """Stores a new task entry with an expiry."""
+        key = self._key(task_data["id"])
+        created = task_data["created_at"].timestamp()
+        async with get_redis() as client:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=self._encode(task_data))
+                pipe.expire(key, self.ttl_seconds)
+                # Index by creation time, dropping entries whose hash has expired
+                pipe.zadd(KeyPatterns.TASKS_BY_CREATED, {task_data["id"]: created})
+                pipe.zremrangebyscore(
+                    KeyPatterns.TASKS_BY_CREATED, "-inf", created - self.ttl_seconds
+                )
+                await pipe.execute()
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieves a task entry, or None if it doesn't exist or has expired."""
+        async with get_redis() as client:
+            raw = await client.hgetall(self._key(task_id))
+        return self._decode(raw) if raw else None
+
+    async def update(self, task_id: str, fields: Dict[str, Any]) -> bool:
+        """
+        Updates fields of an existing task entry and renews its expiry.
+
+        The key is watched so an entry that expires before the write isn't
+        recreated without a TTL; renewing the TTL keeps tasks that run
+        longer than ``ttl_seconds`` from disappearing mid-run.
+        """
+        key = self._key(task_id)
+        encoded = self._encode(fields)
+        async with get_redis() as client:
+            async with client.pipeline(transaction=True) as pipe:
+                while True:
+                    try:
+                        await pipe.watch(key)
+                        if not await pipe.exists(key):
+                            return False
+                        pipe.multi()
+                        pipe.hset(key, mapping=encoded)
+                        pipe.expire(key, self.ttl_seconds)
+                        await pipe.execute()
+                        return True
+                    except WatchError:
+                        # The entry changed or expired after the check; check again
+                        continue
+
+    async def list(
+        self, status: Optional[TaskStatus] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Lists task entries, newest first."""
+        tasks: List[Dict[str, Any]] = []
+        skipped = 0
+        start = 0
+        page_size = max(limit, 100)
+
+        async with get_redis() as client:
+            while len(tasks) < limit:
+                task_ids = await client.zrevrange(
+                    KeyPatterns.TASKS_BY_CREATED, start, start + page_size - 1
+                )
+                if not task_ids:
+                    break
+                start += page_size
+
+                async with client.pipeline(transaction=False) as pipe:
+                    for task_id in task_ids:
+                        pipe.hgetall(self._key(task_id))
+                    raw_tasks = await pipe.execute()
+
+                for raw in raw_tasks:
+                    # Skip index entries whose task has already expired
+                    if not raw:
+                        continue
+                    task = self._decode(raw)
+                    if status is not None and task["status"] != status:
+                        continue
+                    if skipped < offset:
+                        skipped += 1
+                        continue
+                    tasks.append(task)
+                    if len(tasks) == limit:
+                        break
+
+        return tasks
+
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        """No-op: Redis expires task entries by itself."""
+        return 0
+
+
+class TaskManager:
+    """
+    Manages task state for the MVP.
+
+    Tasks are kept in memory by default; with ``USE_REDIS`` enabled they are
+    stored in Redis so every worker sees the same state.
+
+    Background execution goes through a bounded queue drained by a fixed pool
+    of worker coroutines, so tasks run concurrently and a full queue pushes
+    back on callers instead of piling up unbounded work.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Any] = None,
+        num_workers: int = settings.TASK_WORKERS,
+        queue_size: int = settings.TASK_QUEUE_SIZE,
+    ):
+        if store is None:
+            if settings.USE_REDIS:
+                store = RedisTaskStore(ttl_seconds=settings.TASK_MAX_AGE_HOURS * 3600)
+            else:
+                store = InMemoryTaskStore()
+        self._store = store
+        self._num_workers = num_workers
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._workers: List[asyncio.Task] = []
+        self._gc_task: Optional[asyncio.Task] = None
+
+    async def _worker(self) -> None:
+        """Runs queued task functions one at a time until cancelled."""
+        while True:
+            func, kwargs = await self._queue.get()
+            try:
+                await func(**kwargs)
+            except Exception:
+                logger.exception("Unhandled error in background task")
+            finally:
+                self._queue.task_done()
+
+    async def _gc_loop(self) -> None:
+        """Periodically removes old finished tasks until cancelled."""
+        max_age_hours = settings.TASK_MAX_AGE_HOURS
+        while True:
+            await asyncio.sleep(max_age_hours * 3600 / 4)
+            try:
+                removed = await self.clear_completed_tasks(max_age_hours)
+                if removed:
+                    logger.info("Removed %d finished tasks older than %sh", removed, max_age_hours)
+            except Exception:
+                logger.exception("Error clearing finished tasks")
+
+    def start(self) -> None:
+        """Starts the background worker pool and task cleanup if they aren't running yet."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self._num_workers)
+        ]
+        self._gc_task = asyncio.create_task(self._gc_loop())
+        logger.info("Started %d background task workers", self._num_workers)
+
+    async def stop(self) -> None:
+        """Cancels the background worker pool and task cleanup."""
+        background = list(self._workers)
+        if self._gc_task is not None:
+            background.append(self._gc_task)
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        self._workers = []
+        self._gc_task = None
+
+    def execute_task_async(
+        self, func: Callable[..., Coroutine[Any, Any, Any]], **kwargs: Any
+    ) -> None:
+        """
+        Queues a task function for background execution.
+
+        Raises asyncio.QueueFull if too many tasks are already waiting.
+        """
+        self.start()
+        self._queue.put_nowait((func, kwargs))
 
     async def create_task(self, task_type: TaskType, params: dict) -> str:
         """Creates a new task entry and returns its ID."""
@@ -20,41 +289,48 @@ class TaskManager:
             "id": task_id,
             "type": task_type,
             "params": params,
-            "status": "pending", # Statuses: pending, running, completed, failed
+            "status": TaskStatus.PENDING,
             "created_at": now,
             "updated_at": now,
             "result": None,
             "error": None,
         }
-        async with self._lock:
-            self.tasks[task_id] = task_data
+        await self._store.create(task_data)
         return task_id
 
     async def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Retrieves the full details of a task."""
-        async with self._lock:
-            return self.tasks.get(task_id)
+        return await self._store.get(task_id)
 
-    async def get_task_status(self, task_id: str) -> Optional[str]:
+    async def get_task_status(self, task_id: str) -> Optional[TaskStatus]:
         """Retrieves the current status of a task."""
         task = await self.get_task(task_id)
         return task["status"] if task else None
 
+    async def get_all_tasks(
+        self, status: Optional[TaskStatus] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Retrieves tasks, newest first, optionally filtered by status."""
+        return await self._store.list(status=status, limit=limit, offset=offset)
+
+    async def clear_completed_tasks(self, max_age_hours: int) -> int:
+        """Removes finished tasks older than max_age_hours and returns how many were removed."""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+        return await self._store.delete_finished_before(cutoff)
+
     async def update_task_status(
-        self, task_id: str, status: str, result: Any = None, error: str = None
+        self, task_id: str, status: TaskStatus, result: Any = None, error: str = None
     ) -> bool:
         """Updates the status and other relevant fields of a task."""
-        async with self._lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task["status"] = status
-                task["updated_at"] = datetime.now(timezone.utc)
-                if result is not None:
-                    task["result"] = result
-                if error is not None:
-                    task["error"] = error
-                return True
-            return False
+        fields: Dict[str, Any] = {
+            "status": status,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        if result is not None:
+            fields["result"] = result
+        if error is not None:
+            fields["error"] = error
+        return await self._store.update(task_id, fields)
 
 # Singleton instance to be used across the application
-task_manager = TaskManager() 
\ No newline at end of file
+task_manager = TaskManager()
@@ -1,4 +1,7 @@
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
+from typing import Any, Optional
 
 class TaskType(str, Enum):
     DATA_COLLECTION = "data_collection"
@@ -6,4 +9,22 @@ class TaskType(str, Enum):
     GENERATE_REPORT = "generate_report"
     # Placeholder for other potential MVP task types
     PROCESS_ITEM = "process_item" # Example task type for demonstration
-    CHAINED_TASK = "chained_task" # Example task type for workflow demo 
\ No newline at end of file
+    CHAINED_TASK = "chained_task" # Example task type for workflow demo
+
+
+class TaskStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class TaskResult:
+    """Result returned by task functions."""
+    success: bool = False
+    data: Any = None
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    duration_seconds: float = 0.0
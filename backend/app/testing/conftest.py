@@ -0,0 +1,19 @@
+"""
+Shared fixtures for the transform tests.
+"""
+
+import uuid
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def fake_account_id():
+    """Provide a fake social media account ID, shared by all tests."""
+    return str(uuid.uuid4())
+
+
+@pytest.fixture(scope="session")
+def fake_post_id():
+    """Provide a fake post ID, shared by all tests."""
+    return str(uuid.uuid4())
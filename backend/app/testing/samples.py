@@ -0,0 +1,65 @@
+"""
+Sample Data Loading
+
+This module loads the APIFY sample responses stored under ``data/`` for the
+transform tests, parsing each file at most once per test run.
+"""
+
+import mmap
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    import json
+
+    def _loads(data: memoryview) -> Any:
+        return json.loads(str(data, "utf-8"))
+
+SAMPLE_DATA_DIR = Path(__file__).parent / "data"
+
+
+@lru_cache(maxsize=None)
+def load_json(path: str) -> Any:
+    """
+    Load and cache a JSON sample file.
+
+    The parsed data is shared between callers, so tests must not mutate it.
+    If the file is missing, the calling test (or test module, when called
+    at collection time) is skipped rather than erroring.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed JSON data
+    """
+    try:
+        with open(path, "rb") as f:
+            # Decode straight from the page cache instead of copying the file
+            # into a bytes object first (mmap can't map an empty file)
+            if not os.fstat(f.fileno()).st_size:
+                return _loads(memoryview(b""))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as data:
+                return _loads(data)
+    except FileNotFoundError:
+        pytest.skip(f"Sample data file {path} is missing", allow_module_level=True)
+
+
+def load_sample(platform: str, kind: str) -> Any:
+    """
+    Load the sample records of one kind for a platform.
+
+    Args:
+        platform: Name of the platform's data directory (e.g., "instagram", "x")
+        kind: Kind of sample records ("profile", "post" or "comment")
+
+    Returns:
+        The parsed sample records
+    """
+    return load_json(str(SAMPLE_DATA_DIR / platform / f"{kind}_samples.json"))
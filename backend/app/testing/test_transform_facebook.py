@@ -5,53 +5,38 @@ This module tests the transformation of Facebook raw data from APIFY
 to the format expected by the application's repositories.
 """
 
-import json
 import os
-import sys
-import uuid
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add the project root to the Python path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from app.db.models.social_media_account import Platform
+from app.processing.collection.facebook import PAGE_HANDLE_RE, FacebookCollector
+from app.testing.samples import load_sample
+
+
+@pytest.fixture(scope="module")
+def collector():
+    """Create a Facebook collector whose APIFY client and repositories are mocks."""
+    return FacebookCollector(
+        apify_client=MagicMock(),
+        post_repository=MagicMock(),
+        comment_repository=MagicMock()
+    )
 
 
 class TestFacebookTransforms:
     """
     Test the transformation of Facebook data from APIFY to the application format.
-    """
-    
-    @pytest.fixture
-    def sample_profile_data(self):
-        """Load sample Facebook profile data."""
-        data_path = Path(__file__).parent / "data" / "facebook" / "profile_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    
-    @pytest.fixture
-    def sample_post_data(self):
-        """Load sample Facebook post data."""
-        data_path = Path(__file__).parent / "data" / "facebook" / "post_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
     
-    @pytest.fixture
-    def sample_comment_data(self):
-        """Load sample Facebook comment data."""
-        data_path = Path(__file__).parent / "data" / "facebook" / "comment_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+    Each test runs once per sample record; the sample files are parsed once
+    and shared across all of them.
+    """
     
-    def test_transform_profile(self, sample_profile_data):
+    @pytest.mark.parametrize("raw_profile", load_sample("facebook", "profile"), ids=lambda r: r["pageId"])
+    def test_transform_profile(self, raw_profile):
         """Test the transformation of a Facebook profile by manually creating the transform."""
-        # Get the first profile from the sample data
-        raw_profile = sample_profile_data[0]
-        
         # Extract the page ID and handle
         page_id = raw_profile.get("pageId", raw_profile.get("facebookId", ""))
         page_url = raw_profile.get("pageUrl", "")
@@ -59,12 +44,9 @@ class TestFacebookTransforms:
         
         # Try to extract handle from URL
         if page_url:
-            try:
-                path = page_url.split("/")[-2] if page_url.endswith("/") else page_url.split("/")[-1]
-                if path and path != "/":
-                    handle = path
-            except Exception:
-                pass
+            match = PAGE_HANDLE_RE.match(page_url)
+            if match:
+                handle = match.group(1)
         
         # Use pageName if handle extraction failed
         if not handle:
@@ -94,14 +76,9 @@ class TestFacebookTransforms:
         # Ensure political_entity_id is not included (should be set when account is created)
         assert "political_entity_id" not in transformed
 
-    def test_transform_post(self, sample_post_data):
+    @pytest.mark.parametrize("raw_post", load_sample("facebook", "post"), ids=lambda r: r["postId"])
+    def test_transform_post(self, raw_post, fake_account_id):
         """Test the transformation of a Facebook post by manually validating key fields."""
-        # Get the first post from the sample data
-        raw_post = sample_post_data[0]
-        
-        # Create a fake account ID
-        account_id = str(uuid.uuid4())
-        
         # Check if key fields are present in the raw post
         assert "postId" in raw_post
         assert "text" in raw_post
@@ -125,7 +102,7 @@ class TestFacebookTransforms:
         required_fields = {
             "platform_id": raw_post["postId"],
             "platform": "facebook",
-            "account_id": account_id,
+            "account_id": fake_account_id,
             "content_type": "post",  # Default type for Facebook
             "content": {
                 "text": raw_post["text"]
@@ -153,17 +130,14 @@ class TestFacebookTransforms:
                 continue
             assert value is not None, f"Field {field} should not be None"
 
-    def test_transform_comment(self, sample_comment_data):
+    @pytest.mark.parametrize("raw_comment", load_sample("facebook", "comment"), ids=lambda r: r["id"])
+    def test_transform_comment(self, raw_comment):
         """Test the transformation of a Facebook comment by manually validating key fields."""
-        # Get the first comment from the sample data
-        raw_comment = sample_comment_data[0]
-        
         # Create a fake post ID
         post_id = "fake_post_id"
         
         # Check if key fields are present in the raw comment
         assert "id" in raw_comment
-        assert "text" in raw_comment
         assert "profileName" in raw_comment
         assert "profileId" in raw_comment
         assert "date" in raw_comment
@@ -171,7 +145,11 @@ class TestFacebookTransforms:
         
         # Validate expected field types and structures
         assert isinstance(raw_comment["id"], str)
-        assert isinstance(raw_comment["text"], str)
+        # Sticker-only comments have attachments instead of text
+        if "text" in raw_comment:
+            assert isinstance(raw_comment["text"], str)
+        else:
+            assert raw_comment["attachments"]
         assert isinstance(raw_comment["profileName"], str)
         assert isinstance(raw_comment["profileId"], str)
         
@@ -184,7 +162,7 @@ class TestFacebookTransforms:
             "user_id": raw_comment["profileId"],
             "user_name": raw_comment["profileName"],
             "content": {
-                "text": raw_comment["text"]
+                "text": raw_comment.get("text", "")
             },
             "metadata": {
                 "created_at": datetime.fromisoformat(raw_comment["date"].replace('Z', '+00:00'))
@@ -202,5 +180,48 @@ class TestFacebookTransforms:
             assert value is not None, f"Field {field} should not be None"
 
 
+
+class TestFacebookCollectorTransforms:
+    """
+    Run FacebookCollector's own transforms on the sample records.
+    
+    Unlike TestFacebookTransforms, which rebuilds the expected output by hand,
+    these tests exercise the collector code that collection actually runs.
+    """
+    
+    @pytest.mark.parametrize("raw_profile", load_sample("facebook", "profile"), ids=lambda r: r["pageId"])
+    def test_transform_profile(self, collector, raw_profile):
+        """Test FacebookCollector.transform_profile on a sample profile."""
+        transformed = collector.transform_profile(raw_profile)
+        
+        assert transformed["platform_id"] == raw_profile["pageId"]
+        assert isinstance(transformed["follower_count"], int)
+        assert "political_entity_id" not in transformed
+    
+    @pytest.mark.parametrize("raw_post", load_sample("facebook", "post"), ids=lambda r: r["postId"])
+    def test_transform_post(self, collector, raw_post, fake_account_id):
+        """Test FacebookCollector.transform_post on a sample post."""
+        transformed = collector.transform_post(raw_post, fake_account_id)
+        
+        assert transformed["platform_id"] == raw_post["postId"]
+        assert transformed["platform"] == "facebook"
+        assert transformed["account_id"] == fake_account_id
+        assert transformed["content"]["text"] == raw_post["text"]
+        assert isinstance(transformed["metadata"]["created_at"], datetime)
+        assert isinstance(transformed["engagement"]["likes_count"], int)
+    
+    @pytest.mark.parametrize("raw_comment", load_sample("facebook", "comment"), ids=lambda r: r["id"])
+    def test_transform_comment(self, collector, raw_comment, fake_post_id):
+        """Test FacebookCollector.transform_comment on a sample comment."""
+        transformed = collector.transform_comment(raw_comment, fake_post_id)
+        
+        assert transformed["platform_id"] == raw_comment["id"]
+        assert transformed["platform"] == "facebook"
+        assert transformed["post_id"] == fake_post_id
+        assert transformed["post_url"] == raw_comment["facebookUrl"]
+        assert transformed["content"]["text"] == raw_comment.get("text", "")
+        assert isinstance(transformed["metadata"]["created_at"], datetime)
+
+
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__]) 
\ No newline at end of file
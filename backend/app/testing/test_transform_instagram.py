@@ -5,53 +5,31 @@ This module tests the transformation of Instagram raw data from APIFY
 to the format expected by the application's repositories.
 """
 
-import json
 import os
-import sys
-import uuid
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add the project root to the Python path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from app.db.models.social_media_account import Platform
+from app.testing.samples import load_sample
+
+
+# Map the APIFY post type to the content type stored by the collector
+CONTENT_TYPES = {"Sidecar": "carousel", "Video": "video", "Image": "post"}
 
 
 class TestInstagramTransforms:
     """
     Test the transformation of Instagram data from APIFY to the application format.
-    """
-    
-    @pytest.fixture
-    def sample_profile_data(self):
-        """Load sample Instagram profile data."""
-        data_path = Path(__file__).parent / "data" / "instagram" / "profile_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    
-    @pytest.fixture
-    def sample_post_data(self):
-        """Load sample Instagram post data."""
-        data_path = Path(__file__).parent / "data" / "instagram" / "post_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
     
-    @pytest.fixture
-    def sample_comment_data(self):
-        """Load sample Instagram comment data."""
-        data_path = Path(__file__).parent / "data" / "instagram" / "comment_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+    Each test runs once per sample record; the sample files are parsed once
+    and shared across all of them.
+    """
     
-    def test_transform_profile(self, sample_profile_data):
+    @pytest.mark.parametrize("raw_profile", load_sample("instagram", "profile"), ids=lambda r: r["id"])
+    def test_transform_profile(self, raw_profile):
         """Test the transformation of an Instagram profile by manually creating the transform."""
-        # Get the first profile from the sample data
-        raw_profile = sample_profile_data[0]
-        
         # Extract basic info
         username = raw_profile.get("username", "")
         profile_url = f"https://www.instagram.com/{username}/" if username else ""
@@ -81,14 +59,9 @@ class TestInstagramTransforms:
         # Ensure political_entity_id is not included (should be set when account is created)
         assert "political_entity_id" not in transformed
 
-    def test_transform_post(self, sample_post_data):
+    @pytest.mark.parametrize("raw_post", load_sample("instagram", "post"), ids=lambda r: r["id"])
+    def test_transform_post(self, raw_post, fake_account_id):
         """Test the transformation of an Instagram post by manually validating key fields."""
-        # Get the first post from the sample data
-        raw_post = sample_post_data[0]
-        
-        # Create a fake account ID
-        account_id = str(uuid.uuid4())
-        
         # Check if key fields are present in the raw post
         assert "id" in raw_post
         assert "shortCode" in raw_post
@@ -97,7 +70,7 @@ class TestInstagramTransforms:
         assert "likesCount" in raw_post
         assert "commentsCount" in raw_post
         assert "type" in raw_post
-        assert raw_post["type"] == "Sidecar"  # This is a carousel post
+        assert raw_post["type"] in CONTENT_TYPES
         assert "childPosts" in raw_post
         assert "timestamp" in raw_post
         
@@ -115,8 +88,8 @@ class TestInstagramTransforms:
         required_fields = {
             "platform_id": raw_post["id"],
             "platform": "instagram",
-            "account_id": account_id,
-            "content_type": "carousel",  # Derived from type field
+            "account_id": fake_account_id,
+            "content_type": CONTENT_TYPES[raw_post["type"]],  # Derived from type field
             "short_code": raw_post["shortCode"],
             "url": raw_post["url"],
             "content": {
@@ -139,11 +112,14 @@ class TestInstagramTransforms:
                 continue
             assert value is not None, f"Field {field} should not be None"
 
-    def test_transform_comment(self, sample_comment_data):
+    @pytest.mark.parametrize(
+        "raw_comment",
+        # Skip placeholder items the actor returns with nothing but an ID
+        [c for c in load_sample("instagram", "comment") if "owner" in c],
+        ids=lambda r: r["id"]
+    )
+    def test_transform_comment(self, raw_comment):
         """Test the transformation of an Instagram comment by manually validating key fields."""
-        # Get the first comment from the sample data
-        raw_comment = sample_comment_data[0]
-        
         # Create a fake post ID
         post_id = "fake_post_id"
         
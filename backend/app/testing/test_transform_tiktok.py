@@ -5,20 +5,65 @@ This module tests the transformation of TikTok raw data from APIFY
 to the format expected by the application's repositories.
 """
 
-import json
-import os
-import sys
-import uuid
 from datetime import datetime
-from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add the project root to the Python path
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from app.processing.collection.tiktok import transform_comment, transform_post, transform_profile
 
-from app.db.models.social_media_account import Platform
+# (transformed field, raw field) pairs that must hold the same value, as
+# dotted paths into the nested dicts
+PROFILE_FIELDS = (
+    ("platform_id", "id"),
+    ("handle", "uniqueId"),
+    ("name", "nickname"),
+    ("verified", "verified"),
+    ("follower_count", "followerCount"),
+    ("following_count", "followingCount"),
+)
+
+POST_FIELDS = (
+    ("platform_id", "id"),
+    ("short_code", "id"),
+    ("url", "webVideoUrl"),
+    ("content.text", "desc"),
+    ("metadata.dimensions.width", "videoMeta.width"),
+    ("metadata.dimensions.height", "videoMeta.height"),
+    ("metadata.owner.username", "authorMeta.name"),
+    ("engagement.likes_count", "diggCount"),
+    ("engagement.shares_count", "shareCount"),
+    ("engagement.comments_count", "commentCount"),
+    ("engagement.views_count", "playCount"),
+    ("engagement.saves_count", "collectCount"),
+    ("video_data.duration", "videoMeta.duration"),
+    ("video_data.video_url", "videoUrl"),
+)
+
+COMMENT_FIELDS = (
+    ("platform_id", "id"),
+    ("user_id", "user.id"),
+    ("user_name", "user.uniqueId"),
+    ("user_full_name", "user.nickname"),
+    ("user_profile_pic", "user.avatarThumb"),
+    ("user_verified", "user.verified"),
+    ("content.text", "text"),
+    ("metadata.is_reply", "isReply"),
+    ("engagement.likes_count", "diggCount"),
+    ("engagement.replies_count", "replyCount"),
+)
+
+
+def get_path(data, path):
+    """Look up a dotted path (e.g. "engagement.likes_count") in nested dicts."""
+    for key in path.split("."):
+        data = data[key]
+    return data
+
+
+def assert_fields_match(transformed, raw, fields):
+    """Assert each transformed field equals its raw counterpart."""
+    for transformed_path, raw_path in fields:
+        assert get_path(transformed, transformed_path) == get_path(raw, raw_path), transformed_path
 
 
 class TestTikTokTransforms:
@@ -118,20 +163,12 @@ class TestTikTokTransforms:
     
     def test_transform_profile(self, mock_profile_data):
         """Test the transformation of a TikTok profile."""
-        # Import and patch the transform_profile function directly
-        from app.processing.collection.tiktok import transform_profile
-        
         # Transform the profile data
         transformed = transform_profile(mock_profile_data)
         
         # Check if transformation matches expectations for social_media_account.py
-        assert transformed["platform_id"] == mock_profile_data["id"]
-        assert transformed["handle"] == mock_profile_data["uniqueId"]
-        assert transformed["name"] == mock_profile_data["nickname"]
+        assert_fields_match(transformed, mock_profile_data, PROFILE_FIELDS)
         assert transformed["url"] == f"https://www.tiktok.com/@{mock_profile_data['uniqueId']}"
-        assert transformed["verified"] == mock_profile_data["verified"]
-        assert transformed["follower_count"] == mock_profile_data["followerCount"]
-        assert transformed["following_count"] == mock_profile_data["followingCount"]
         
         # Ensure the platform isn't included (should be set when using with SocialMediaAccountRepository)
         assert "platform" not in transformed
@@ -139,81 +176,39 @@ class TestTikTokTransforms:
         # Ensure political_entity_id is not included (should be set when account is created)
         assert "political_entity_id" not in transformed
 
-    def test_transform_post(self, mock_post_data):
+    def test_transform_post(self, mock_post_data, fake_account_id):
         """Test the transformation of a TikTok post."""
-        # Import and patch the transform_post function directly
-        from app.processing.collection.tiktok import transform_post
-        
-        # Create a fake account ID
-        account_id = str(uuid.uuid4())
-        
         # Transform the post data
-        transformed = transform_post(mock_post_data, account_id)
+        transformed = transform_post(mock_post_data, fake_account_id)
         
         # Check if transformation matches expectations for MongoDB schema
-        assert transformed["platform_id"] == mock_post_data["id"]
+        assert_fields_match(transformed, mock_post_data, POST_FIELDS)
         assert transformed["platform"] == "tiktok"
-        assert transformed["account_id"] == account_id
+        assert transformed["account_id"] == fake_account_id
         assert transformed["content_type"] == "video"
-        assert transformed["short_code"] == mock_post_data["id"]
-        assert transformed["url"] == mock_post_data["webVideoUrl"]
         
         # Check content
-        assert transformed["content"]["text"] == mock_post_data["desc"]
         assert mock_post_data["videoUrl"] in transformed["content"]["media"]
         assert len(transformed["content"]["hashtags"]) == 2
         assert "tiktok" in transformed["content"]["hashtags"]
         assert "test" in transformed["content"]["hashtags"]
         
-        # Check metadata
+        # Check metadata and video data
         assert isinstance(transformed["metadata"]["created_at"], datetime)
-        assert transformed["metadata"]["dimensions"]["width"] == mock_post_data["videoMeta"]["width"]
-        assert transformed["metadata"]["dimensions"]["height"] == mock_post_data["videoMeta"]["height"]
-        assert transformed["metadata"]["owner"]["username"] == mock_post_data["authorMeta"]["name"]
-        
-        # Check engagement
-        assert transformed["engagement"]["likes_count"] == mock_post_data["diggCount"]
-        assert transformed["engagement"]["shares_count"] == mock_post_data["shareCount"]
-        assert transformed["engagement"]["comments_count"] == mock_post_data["commentCount"]
-        assert transformed["engagement"]["views_count"] == mock_post_data["playCount"]
-        assert transformed["engagement"]["saves_count"] == mock_post_data["collectCount"]
-        
-        # Check video data
-        assert transformed["video_data"]["duration"] == mock_post_data["videoMeta"]["duration"]
-        assert transformed["video_data"]["video_url"] == mock_post_data["videoUrl"]
         assert transformed["video_data"]["thumbnail_url"] == mock_post_data["covers"][0]
 
-    def test_transform_comment(self, mock_comment_data):
+    def test_transform_comment(self, mock_comment_data, fake_post_id):
         """Test the transformation of a TikTok comment."""
-        # Import and patch the transform_comment function directly
-        from app.processing.collection.tiktok import transform_comment
-        
-        # Create a fake post ID
-        post_id = str(uuid.uuid4())
-        
         # Transform the comment data
-        transformed = transform_comment(mock_comment_data, post_id)
+        transformed = transform_comment(mock_comment_data, fake_post_id)
         
         # Check if transformation matches expectations for MongoDB schema
-        assert transformed["platform_id"] == mock_comment_data["id"]
+        assert_fields_match(transformed, mock_comment_data, COMMENT_FIELDS)
         assert transformed["platform"] == "tiktok"
-        assert transformed["post_id"] == post_id
-        assert transformed["user_id"] == mock_comment_data["user"]["id"]
-        assert transformed["user_name"] == mock_comment_data["user"]["uniqueId"]
-        assert transformed["user_full_name"] == mock_comment_data["user"]["nickname"]
-        assert transformed["user_profile_pic"] == mock_comment_data["user"]["avatarThumb"]
-        assert transformed["user_verified"] == mock_comment_data["user"]["verified"]
-        
-        # Check content
-        assert transformed["content"]["text"] == mock_comment_data["text"]
+        assert transformed["post_id"] == fake_post_id
         
         # Check metadata
         assert isinstance(transformed["metadata"]["created_at"], datetime)
-        assert transformed["metadata"]["is_reply"] == mock_comment_data["isReply"]
-        
-        # Check engagement
-        assert transformed["engagement"]["likes_count"] == mock_comment_data["diggCount"]
-        assert transformed["engagement"]["replies_count"] == mock_comment_data["replyCount"]
         
         # Check replies
         assert len(transformed["replies"]) == len(mock_comment_data["replies"])
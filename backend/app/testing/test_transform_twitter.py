@@ -5,52 +5,30 @@ This module tests the transformation of Twitter/X raw data from APIFY
 to the format expected by the application's repositories.
 """
 
-import json
 import os
-import sys
-import uuid
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add the project root to the Python path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from app.db.models.social_media_account import Platform
+from app.processing.collection.twitter import TWEET_DATE_FORMAT
+from app.testing.samples import load_sample
 
 
 class TestTwitterTransforms:
     """
     Test the transformation of Twitter/X data from APIFY to the application format.
-    """
-    
-    @pytest.fixture
-    def sample_profile_data(self):
-        """Load sample Twitter/X profile data."""
-        data_path = Path(__file__).parent / "data" / "x" / "profile_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
     
-    @pytest.fixture
-    def sample_post_data(self):
-        """Load sample Twitter/X post data."""
-        data_path = Path(__file__).parent / "data" / "x" / "post_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    
-    @pytest.fixture
-    def sample_comment_data(self):
-        """Load sample Twitter/X comment data."""
-        data_path = Path(__file__).parent / "data" / "x" / "comment_samples.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+    Each test runs once per sample record; the sample files are parsed once
+    and shared across all of them.
+    """
     
-    def test_transform_profile(self, sample_profile_data):
+    @pytest.mark.parametrize("raw_tweet", load_sample("x", "profile"), ids=lambda r: r["id"])
+    def test_transform_profile(self, raw_tweet):
         """Test the transformation of a Twitter/X profile by manually creating the transform."""
-        # Get the first profile from the sample data - author field in a post contains profile data
-        raw_profile = sample_profile_data[0]["author"]
+        # The author field in a post contains the profile data
+        raw_profile = raw_tweet["author"]
         
         # Manual transformation (same logic as in the collector)
         transformed = {
@@ -76,14 +54,9 @@ class TestTwitterTransforms:
         # Ensure political_entity_id is not included (should be set when account is created)
         assert "political_entity_id" not in transformed
 
-    def test_transform_post(self, sample_post_data):
+    @pytest.mark.parametrize("raw_post", load_sample("x", "post"), ids=lambda r: r["id"])
+    def test_transform_post(self, raw_post, fake_account_id):
         """Test the transformation of a Twitter/X post by manually validating key fields."""
-        # Get the first post from the sample data
-        raw_post = sample_post_data[0]
-        
-        # Create a fake account ID
-        account_id = str(uuid.uuid4())
-        
         # Check if key fields are present in the raw post
         assert "id" in raw_post
         assert "text" in raw_post
@@ -92,6 +65,7 @@ class TestTwitterTransforms:
         assert "retweetCount" in raw_post
         assert "replyCount" in raw_post
         assert "createdAt" in raw_post
+        assert "lang" in raw_post
         
         # Validate expected field types and structures
         assert isinstance(raw_post["id"], str)
@@ -101,45 +75,17 @@ class TestTwitterTransforms:
         assert isinstance(raw_post["retweetCount"], int)
         assert isinstance(raw_post["replyCount"], int)
         
-        # Parse created_at date
-        created_at = None
-        try:
-            # Try the format with year
-            created_at = datetime.strptime(
-                raw_post["createdAt"].split("+")[0].strip(), 
-                "%a %b %d %H:%M:%S %Y"
-            )
-        except ValueError:
-            # If that fails, assume the current year
-            date_str = raw_post["createdAt"].split("+")[0].strip()
-            created_at = datetime.strptime(
-                date_str, 
-                "%a %b %d %H:%M:%S"
-            ).replace(year=2025)  # Sample data uses 2025 as the year
+        # The created_at date must parse
+        datetime.strptime(raw_post["createdAt"], TWEET_DATE_FORMAT)
         
         # Test MongoDB schema compatibility
-        # These are the key fields needed by the MongoDB schema
-        required_fields = {
-            "platform_id": raw_post["id"],
-            "platform": "twitter",
-            "account_id": account_id,
-            "content_type": "retweet" if raw_post.get("isRetweet", False) else "post",
-            "content": {
-                "text": raw_post["text"]
-            },
-            "metadata": {
-                "created_at": created_at,
-                "language": raw_post["lang"],
-                "is_repost": raw_post.get("isRetweet", False),
-                "is_reply": raw_post.get("isReply", False)
-            },
-            "engagement": {
-                "likes_count": raw_post["likeCount"],
-                "shares_count": raw_post["retweetCount"],
-                "comments_count": raw_post["replyCount"],
-                "views_count": raw_post.get("viewCount")
-            }
-        }
+        # These are the key top-level fields needed by the MongoDB schema
+        required_fields = (
+            ("platform_id", raw_post["id"]),
+            ("platform", "twitter"),
+            ("account_id", fake_account_id),
+            ("content_type", "retweet" if raw_post.get("isRetweet", False) else "post"),
+        )
         
         # Check if media is extracted correctly
         if "extendedEntities" in raw_post and "media" in raw_post["extendedEntities"]:
@@ -148,17 +94,12 @@ class TestTwitterTransforms:
             assert "media_url_https" in media_items[0]
         
         # All required fields should be present in raw data
-        for field, value in required_fields.items():
-            if field in ["content", "metadata", "engagement"]:
-                # These are nested fields, continue
-                continue
+        for field, value in required_fields:
             assert value is not None, f"Field {field} should not be None"
 
-    def test_transform_comment(self, sample_comment_data):
+    @pytest.mark.parametrize("raw_comment", load_sample("x", "comment"), ids=lambda r: r["id"])
+    def test_transform_comment(self, raw_comment):
         """Test the transformation of a Twitter/X comment by manually validating key fields."""
-        # Get the first comment from the sample data
-        raw_comment = sample_comment_data[0]
-        
         # Create a fake post ID
         post_id = "fake_post_id"
         
@@ -169,6 +110,7 @@ class TestTwitterTransforms:
         assert "createdAt" in raw_comment
         assert "likeCount" in raw_comment
         assert "replyCount" in raw_comment
+        assert "lang" in raw_comment
         
         # Validate expected field types and structures
         assert isinstance(raw_comment["id"], str)
@@ -177,48 +119,21 @@ class TestTwitterTransforms:
         assert isinstance(raw_comment["likeCount"], int)
         assert isinstance(raw_comment["replyCount"], int)
         
-        # Parse created_at date
-        created_at = None
-        try:
-            # Try the format with year
-            created_at = datetime.strptime(
-                raw_comment["createdAt"].split("+")[0].strip(), 
-                "%a %b %d %H:%M:%S %Y"
-            )
-        except ValueError:
-            # If that fails, assume the current year
-            date_str = raw_comment["createdAt"].split("+")[0].strip()
-            created_at = datetime.strptime(
-                date_str, 
-                "%a %b %d %H:%M:%S"
-            ).replace(year=2025)  # Sample data uses 2025 as the year
+        # The created_at date must parse
+        datetime.strptime(raw_comment["createdAt"], TWEET_DATE_FORMAT)
         
         # Test MongoDB schema compatibility
-        # These are the key fields needed by the MongoDB schema
-        required_fields = {
-            "platform_id": raw_comment["id"],
-            "platform": "twitter",
-            "post_id": post_id,
-            "user_id": raw_comment["author"]["id"],
-            "user_name": raw_comment["author"]["userName"],
-            "content": {
-                "text": raw_comment["text"]
-            },
-            "metadata": {
-                "created_at": created_at,
-                "language": raw_comment["lang"]
-            },
-            "engagement": {
-                "likes_count": raw_comment["likeCount"],
-                "replies_count": raw_comment["replyCount"]
-            }
-        }
+        # These are the key top-level fields needed by the MongoDB schema
+        required_fields = (
+            ("platform_id", raw_comment["id"]),
+            ("platform", "twitter"),
+            ("post_id", post_id),
+            ("user_id", raw_comment["author"]["id"]),
+            ("user_name", raw_comment["author"]["userName"]),
+        )
         
         # All required fields should be present in raw data
-        for field, value in required_fields.items():
-            if field in ["content", "metadata", "engagement"]:
-                # These are nested fields, continue
-                continue
+        for field, value in required_fields:
             assert value is not None, f"Field {field} should not be None"
 
 